@@ -31,7 +31,13 @@ st_autorefresh(interval=REFRESH_INTERVAL_MS, key="ui_refresh_key") # Ativa a aut
 
 # Inicializa as variáveis de estado da sessão do Streamlit, que persistem entre as atualizações.
 if 'num_processes_to_show' not in st.session_state:
-    st.session_state.num_processes_to_show = 10 # Define o número padrão de processos a serem exibidos.
+    # Herda o limite vigente do coletor em vez de um padrão fixo: as âncoras
+    # da grade de diretórios navegam via recarga real da página, que abre uma
+    # sessão nova — sem isso, cada clique de navegação descartaria o número
+    # de processos escolhido pelo usuário e rebaixaria o limite do coletor.
+    # O limite já vive no controller (como current_directory_path), então a
+    # sessão nova só precisa reler de lá. Na primeira carga vale o padrão 10.
+    st.session_state.num_processes_to_show = system_data.limit
 if 'current_path' not in st.session_state:
     st.session_state.current_path = "/" # Define o caminho inicial para a navegação no sistema de arquivos.
 
@@ -16,10 +16,13 @@ class SystemData:
         Inicializa a instância SystemData.
 
         Args:
-            limit (int): O número máximo de processos a serem armazenados na lista `self.processes`.
+            limit (int): O número máximo de processos a serem mantidos no snapshot.
         """
         self.lock = threading.Lock()
-        self.global_info = {
+        self.limit = limit
+        self.current_directory_path = "/"
+
+        default_global_info = {
             "CPU (%)": 0.0,
             "CPU ocioso (%)": 0.0,
             "Memória Usada (KB)": 0,
@@ -30,42 +33,41 @@ class SystemData:
             "Leitura Disco (B/s)": 0.0,
             "Escrita Disco (B/s)": 0.0
         }
-        self.processes = []
-        self.filesystem_info = {}
-        self.limit = limit
-        self.current_directory_path = "/"
-        self.directory_contents = []
+        # Snapshot publicado como uma única tupla: a thread de coleta monta uma
+        # tupla nova a cada atualização e troca a referência de uma só vez, de
+        # modo que os leitores sempre enxergam um conjunto consistente de dados
+        # sem precisar copiar os contêineres a cada leitura.
+        self._snapshot = (default_global_info, [], {}, [], self.current_directory_path)
 
     def update(self):
         """
-        Atualiza as informações globais, a lista de processos e as informações do sistema de arquivos.
+        Atualiza as informações globais, a lista de processos e as informações do sistema de arquivos,
+        publicando o resultado como um novo snapshot.
         """
-        try:
-            infos = get_global_info()
-            procs = get_processes_info(self.limit)
+        # O lock cobre a coleta inteira, não só a troca do snapshot: update()
+        # também é chamado pelo script do Streamlit ao navegar de diretório, e
+        # os caches incrementais do model (slots por PID, fds persistentes)
+        # assumem um único coletor por vez — duas coletas sobrepostas liberam
+        # os slots uma da outra e produzem leituras de CPU absurdas.
+        with self.lock:
+            try:
+                infos = get_global_info()
+                procs = get_processes_info(self.limit)
 
-            fs_info = get_filesystem_info()
-            dir_contents = get_directory_contents(self.current_directory_path)
+                fs_info = get_filesystem_info()
+                dir_contents = get_directory_contents(self.current_directory_path)
 
-            with self.lock:
-                self.global_info = infos
-                self.processes = procs
-                self.filesystem_info = fs_info
-                self.directory_contents = dir_contents
-        except Exception as e:
-            print(f"[ERRO] Falha ao atualizar dados: {e}")
+                self._snapshot = (infos, procs, fs_info, dir_contents, self.current_directory_path)
+            except Exception as e:
+                print(f"[ERRO] Falha ao atualizar dados: {e}")
 
     def get_snapshot(self):
         """
-        Retorna uma cópia instantânea (snapshot) dos dados atuais do sistema.
+        Retorna o snapshot mais recente dos dados do sistema.
+        Como o snapshot é uma tupla trocada atomicamente pela thread de coleta,
+        a leitura é um acesso O(1) a uma referência, sem cópias.
         """
-        with self.lock:
-            current_global_info = self.global_info.copy()
-            current_processes = list(self.processes)
-            current_filesystem_info = self.filesystem_info.copy()
-            current_directory_contents = list(self.directory_contents)
-            current_path = self.current_directory_path
-        return current_global_info, current_processes, current_filesystem_info, current_directory_contents, current_path
+        return self._snapshot
 
     def set_current_directory_path(self, path):
         """
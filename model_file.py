@@ -1,9 +1,39 @@
 import time
-from pathlib import Path
-from datetime import datetime
 import os
 import stat
+import logging
 from model_system import get_username_from_uid_local # Importa a função para obter o nome de usuário
+from model_system import read_proc_file_bytes # Leitura de arquivos /proc com um único read(2)
+from model_system import format_local_timestamp # Formatação memoizada de timestamps
+
+# Cache dos resultados de os.statvfs por ponto de montagem: cada chamada é um
+# syscall que adquire o lock do superbloco do filesystem, e o uso de disco muda
+# devagar na escala de atualização de um dashboard. Entradas de montagens
+# somente leitura nunca expiram; as demais são reaproveitadas dentro da janela
+# abaixo. Chave: ponto de montagem, Valor: (expira_em, dict da partição pronto).
+# Logger do módulo (mesmo racional de model_system): erros por item/montagem
+# são relatados via log.debug, que com o nível padrão WARNING sai quase de
+# graça, sem bloquear o laço em I/O de stdio.
+log = logging.getLogger(__name__)
+
+_STATVFS_TTL_SECONDS = 30.0
+_statvfs_cache = {}
+
+# Filtros de montagens "inúteis", compilados uma vez na carga do módulo:
+# frozenset dá teste de pertencimento O(1) para o tipo de filesystem, e a
+# tupla de prefixos permite um único str.startswith em C por linha, em vez de
+# um generator Python testando prefixo a prefixo.
+_FS_TYPES_IGNORE = frozenset((
+    "sysfs", "proc", "devtmpfs", "tmpfs", "devpts", "debugfs",
+    "securityfs", "fusectl", "cgroup", "overlay", "autofs",
+    "mqueue", "hugetlbfs", "pstore", "rpc_pipefs", "binfmt_misc",
+    "none", "configfs"
+))
+_MOUNT_IGNORE_PREFIXES = (
+    "/sys", "/proc", "/dev", "/run", "/var/lib/docker", "/snap", "/etc/resolv.conf",
+    "/etc/hostname", "/etc/hosts"
+)
+_TMPFS_ALLOWED_PREFIXES = ("/dev/shm", "/run/user")
 
 def get_filesystem_info():
     """
@@ -17,80 +47,84 @@ def get_filesystem_info():
               Ex: {"partitions": [{"name": "/dev/sda1", "mount_point": "/", ...}], "last_update": ...}
     """
     partitions_info = []
+    now = time.time()
     try:
-        # Define tipos de sistema de arquivos e pontos de montagem a serem ignorados.
-        fs_types_to_ignore = [
-            "sysfs", "proc", "devtmpfs", "tmpfs", "devpts", "debugfs",
-            "securityfs", "fusectl", "cgroup", "overlay", "autofs",
-            "mqueue", "hugetlbfs", "pstore", "rpc_pipefs", "binfmt_misc",
-            "none", "configfs"
-        ]
-        mount_points_to_ignore_prefix = [
-            "/sys", "/proc", "/dev", "/run", "/var/lib/docker", "/snap", "/etc/resolv.conf",
-            "/etc/hostname", "/etc/hosts"
-        ]
-
-        # Lê /proc/mounts para obter os pontos de montagem
-        with (Path('/proc') / 'mounts').open('r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) < 2:
-                    continue
+        # Lê /proc/mounts inteiro com um único read(2): o kernel pode alterar o
+        # arquivo entre leituras parciais, e a leitura única garante um
+        # snapshot consistente da tabela de montagem.
+        mounts_text = read_proc_file_bytes('/proc/mounts', 65536).decode('utf-8', 'replace')
+        for line in mounts_text.splitlines():
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+
+            device_name = parts[0]
+            mount_point_str = parts[1]
+            fs_type = parts[2]
+
+            if fs_type in _FS_TYPES_IGNORE:
+                continue
+
+            if mount_point_str.startswith(_MOUNT_IGNORE_PREFIXES):
+                continue
+
+            if not device_name.startswith("/dev") and device_name not in ("rootfs", "tmpfs"):
+                 if fs_type == "tmpfs" and not mount_point_str.startswith(_TMPFS_ALLOWED_PREFIXES):
+                     pass
+                 else:
+                     continue
+
+            # Reaproveita o resultado do tick anterior se ainda estiver dentro
+            # da validade, evitando o statvfs repetido por partição.
+            cached = _statvfs_cache.get(mount_point_str)
+            if cached is not None and cached[0] > now:
+                partitions_info.append(cached[1])
+                continue
 
-                device_name = parts[0]
-                mount_point_str = parts[1]
-                fs_type = parts[2]
+            try:
+                # Usa os.statvfs para obter estatísticas do sistema de arquivos
+                stat_info = os.statvfs(mount_point_str)
 
-                if fs_type in fs_types_to_ignore:
-                    continue
+                total_size_bytes = stat_info.f_blocks * stat_info.f_frsize
+                free_bytes = stat_info.f_bavail * stat_info.f_frsize
+                used_bytes = total_size_bytes - free_bytes
 
-                if any(mount_point_str.startswith(prefix) for prefix in mount_points_to_ignore_prefix):
-                    continue
+                total_size_kb = total_size_bytes / 1024
+                used_kb = used_bytes / 1024
+                free_kb = free_bytes / 1024
 
-                if not device_name.startswith("/dev") and device_name not in ["rootfs", "tmpfs"]:
-                     if fs_type == "tmpfs" and not any(mount_point_str.startswith(prefix) for prefix in ["/dev/shm", "/run/user"]):
-                         pass
-                     else:
-                         continue
-
-                try:
-                    # Usa os.statvfs para obter estatísticas do sistema de arquivos
-                    stat_info = os.statvfs(mount_point_str)
-
-                    total_size_bytes = stat_info.f_blocks * stat_info.f_frsize
-                    free_bytes = stat_info.f_bavail * stat_info.f_frsize
-                    used_bytes = total_size_bytes - free_bytes
-
-                    total_size_kb = total_size_bytes / 1024
-                    used_kb = used_bytes / 1024
-                    free_kb = free_bytes / 1024
-
-                    usage_percent = (used_bytes / total_size_bytes) * 100 if total_size_bytes > 0 else 0.0
-
-                    if total_size_kb <= 0:
-                        continue
-
-                    partitions_info.append({
-                        "name": device_name,
-                        "mount_point": mount_point_str,
-                        "fs_type": fs_type,
-                        "total_size_kb": round(total_size_kb, 2),
-                        "used_kb": round(used_kb, 2),
-                        "free_kb": round(free_kb, 2),
-                        "usage_percent": round(usage_percent, 2)
-                    })
-                except FileNotFoundError:
-                    continue
-                except PermissionError:
-                    continue
-                except Exception as e:
-                    print(f"Erro ao obter informações para {mount_point_str}: {e}")
+                usage_percent = (used_bytes / total_size_bytes) * 100 if total_size_bytes > 0 else 0.0
+
+                if total_size_kb <= 0:
                     continue
 
+                partition_entry = {
+                    "name": device_name,
+                    "mount_point": mount_point_str,
+                    "fs_type": fs_type,
+                    "total_size_kb": round(total_size_kb, 2),
+                    "used_kb": round(used_kb, 2),
+                    "free_kb": round(free_kb, 2),
+                    "usage_percent": round(usage_percent, 2)
+                }
+                # Montagens somente leitura não mudam de ocupação: a entrada
+                # vale para sempre. As demais expiram após a janela do cache.
+                mount_options = parts[3].split(',') if len(parts) > 3 else []
+                expires_at = float('inf') if 'ro' in mount_options else now + _STATVFS_TTL_SECONDS
+                _statvfs_cache[mount_point_str] = (expires_at, partition_entry)
+                partitions_info.append(partition_entry)
+            except FileNotFoundError:
+                continue
+            except PermissionError:
+                continue
+            except Exception as e:
+                log.debug(f"Erro ao obter informações para {mount_point_str}: {e}")
+                continue
+
     except FileNotFoundError:
-        print("Aviso: /proc/mounts não encontrado. Não foi possível coletar informações de partição.")
+        log.debug("Aviso: /proc/mounts não encontrado. Não foi possível coletar informações de partição.")
     except Exception as e:
-        print(f"Erro ao ler /proc/mounts: {e}")
+        log.debug(f"Erro ao ler /proc/mounts: {e}")
 
     return {
         "partitions": partitions_info,
@@ -101,8 +135,9 @@ def get_filesystem_info():
 def get_directory_contents(path_str):
     """
     Lista os arquivos e subdiretórios de um dado caminho, incluindo seus atributos.
-    Utiliza pathlib.Path para manipulação de caminhos e os.stat para obter atributos,
-    que são wrappers para chamadas de sistema diretas.
+    Utiliza os.scandir, que obtém as entradas direto de getdents64 e expõe um
+    stat() com cache por entrada (DirEntry), evitando um segundo syscall de
+    stat por arquivo como aconteceria com iterdir() + stat() separados.
 
     Args:
         path_str (str): O caminho do diretório a ser listado.
@@ -113,29 +148,38 @@ def get_directory_contents(path_str):
               Retorna uma lista vazia e imprime um erro se o caminho for inválido ou inacessível.
     """
     contents = []
-    current_path = Path(path_str)
-
+    # Pares (item_info, mtime) acumulados durante a iteração: a formatação das
+    # datas é feita em lote depois do laço, uma única vez por segundo distinto,
+    # em vez de formatar entrada por entrada.
+    pending_mtimes = []
+    # Cache local de UID → nome de usuário: consultar um dict local primeiro
+    # evita até o custo da chamada à função memoizada quando o dono se repete
+    # (caso típico: quase todas as entradas pertencem ao mesmo usuário).
+    uid_name_cache = {}
     try:
-        if not current_path.is_dir():
-            print(f"Erro: O caminho '{path_str}' não é um diretório ou não existe.")
+        if not os.path.isdir(path_str):
+            log.debug(f"Erro: O caminho '{path_str}' não é um diretório ou não existe.")
             return []
 
-        for item_path in current_path.iterdir():
-            item_name = item_path.name
+        with os.scandir(path_str) as dir_it:
+            dir_entries = list(dir_it)
 
+        for entry in dir_entries:
             item_info = {
-                "name": item_name,
+                "name": entry.name,
                 "type": "N/A",
                 "size": "N/A",
                 "permissions_octal": "N/A", # Mantido no modelo, mas não será exibido na view
                 "permissions_str": "N/A",
                 "last_modified": "N/A",
                 "owner_username": "N/A", # Adicionada a nova chave para o nome do proprietário
-                "full_path": str(item_path)
+                "full_path": entry.path
             }
 
             try:
-                s = item_path.stat()
+                # DirEntry.stat() reaproveita os dados já obtidos na listagem
+                # quando possível, em vez de emitir um stat() extra por item.
+                s = entry.stat()
 
                 item_type = "Desconhecido"
                 if stat.S_ISDIR(s.st_mode):
@@ -156,17 +200,18 @@ def get_directory_contents(path_str):
                 permissions_octal = oct(s.st_mode & 0o777)
                 permissions_str = stat.filemode(s.st_mode)
                 size = s.st_size if item_type == "Arquivo" else "N/A"
-                last_modified = datetime.fromtimestamp(s.st_mtime).strftime('%d/%m/%Y %H:%M:%S')
+                pending_mtimes.append((item_info, int(s.st_mtime)))
 
                 # Obtém o nome de usuário a partir do UID do arquivo
-                owner_username = get_username_from_uid_local(s.st_uid)
+                owner_username = uid_name_cache.get(s.st_uid)
+                if owner_username is None:
+                    owner_username = uid_name_cache.setdefault(s.st_uid, get_username_from_uid_local(s.st_uid))
 
                 item_info.update({
                     "type": item_type,
                     "size": size,
                     "permissions_octal": permissions_octal,
                     "permissions_str": permissions_str,
-                    "last_modified": last_modified,
                     "owner_username": owner_username # Adiciona o nome do proprietário
                 })
 
@@ -175,15 +220,22 @@ def get_directory_contents(path_str):
             except PermissionError:
                 item_info.update({"type": "N/A (Permissão Negada)"})
             except Exception as e:
-                print(f"Erro ao obter detalhes de '{item_path}': {e}")
+                log.debug(f"Erro ao obter detalhes de '{entry.path}': {e}")
                 item_info.update({"type": "N/A (Erro)"})
             finally:
                 contents.append(item_info)
 
+        # Formatação em lote das datas de modificação: formata cada segundo
+        # distinto uma única vez (em diretórios grandes muitas entradas
+        # compartilham o mesmo segundo) e distribui o resultado pronto.
+        unique_mtime_strs = {m: format_local_timestamp(m) for m in set(m for _, m in pending_mtimes)}
+        for item_info, mtime_val in pending_mtimes:
+            item_info["last_modified"] = unique_mtime_strs[mtime_val]
+
     except PermissionError:
-        print(f"Erro de permissão: Não foi possível listar o diretório '{path_str}'.")
+        log.debug(f"Erro de permissão: Não foi possível listar o diretório '{path_str}'.")
         return []
     except Exception as e:
-        print(f"Erro inesperado ao listar diretório '{path_str}': {e}")
+        log.debug(f"Erro inesperado ao listar diretório '{path_str}': {e}")
         return []
     return contents
\ No newline at end of file
@@ -1,9 +1,20 @@
 import time # Para obter o tempo atual e calcular deltas.
-from pathlib import Path # Para manipulação de caminhos de arquivos.
-from datetime import datetime # Para formatar timestamps em datas legíveis.
+import functools # Para memoizar a formatação de timestamps repetidos.
+import numpy as np # Para vetorizar a aritmética por processo (CPU%, memória, taxas de I/O).
+import stat # Para classificar recursos abertos pelo st_mode de um único lstat.
 import os # Para interagir com o sistema operacional (leitura de arquivos /proc).
+import pwd # Para resolver UID -> nome de usuário via libc/nsswitch.
 import socket # Embora importado, não é usado diretamente para sockets de rede na coleta atual.
-import re # Embora importado, não é usado diretamente para expressões regulares na coleta atual.
+import re # Para o filtro compilado de dispositivos de disco em /proc/diskstats.
+import logging # Para relatar erros transitórios sem custo de stdio no caminho quente.
+import concurrent.futures # Pool de threads para sobrepor as leituras por PID.
+import atexit # Para fechar os descritores globais de /proc na saída.
+
+# Logger do módulo: erros transitórios (processo que morreu no meio da coleta,
+# arquivo de /proc que sumiu) são frequentes e esperados; log.debug com o nível
+# padrão WARNING faz o curto-circuito de nível custar um acesso de atributo,
+# sem adquirir o lock de stdio nem dar flush a cada PID que desaparece.
+log = logging.getLogger(__name__)
 
 # Cache global para armazenar dados de chamadas anteriores.
 # para calcular métricas baseadas em diferenças (deltas), como % de CPU e taxas de I/O.
@@ -12,26 +23,240 @@ cache = {
     # Lidos de /proc/stat, são usados para calcular a % de CPU global.
     # Chave: 'idle' (int) - soma dos tempos ociosos, 'total' (int) - soma de todos os tempos.
     'prev_sys_cpu_times': {},
-    # Armazena os últimos tempos de CPU (utime + stime em 'jiffies' ou 'clock ticks') para cada PID.
-    # Usado para calcular a % de CPU de processos individuais. Chave: PID (str), Valor: total_ticks (int).
-    'prev_times': {},
+    # Layout SoA (struct-of-arrays) do cache por processo: em vez de dicts de
+    # dicts (um objeto pequeno por PID, com pointer-chasing a cada consulta),
+    # os valores da coleta anterior ficam em arrays NumPy contíguos, indexados
+    # por um slot compacto atribuído a cada PID em 'pid_index'. Slots de
+    # processos que terminaram voltam para 'free_slots' e são reutilizados.
+    'pid_index': {},   # Chave: PID (int), Valor: índice do slot nos arrays abaixo.
+    'free_slots': [],  # Slots liberados por processos que terminaram.
+    'next_slot': 0,    # Próximo slot inédito quando não há slot livre.
+    'prev_ticks': np.zeros(0, dtype=np.int64),       # utime+stime anteriores por slot.
+    'prev_read_bytes': np.zeros(0, dtype=np.int64),  # read_bytes anteriores por slot.
+    'prev_write_bytes': np.zeros(0, dtype=np.int64), # write_bytes anteriores por slot.
+    # Geração da última varredura que viu cada slot: um scatter vetorizado
+    # marca os slots vivos a cada tick e a limpeza compara as gerações em
+    # lote, sem montar um set de PIDs ativos por coleta.
+    'slot_gen': np.zeros(0, dtype=np.int64),
+    'scan_gen': 0, # Contador de gerações de varredura (incrementa por tick).
+    # Descritores de /proc/[pid]/stat, status e io mantidos abertos entre
+    # ticks: para processos de vida longa a releitura de cada arquivo vira um
+    # único pread(2) no offset 0, sem o trio open()/read()/close() por tick.
+    # Chave: PID (int), Valor: (fd de stat, fd de status, fd de io ou -1
+    # quando /proc/[pid]/io não é legível, ex.: processos de outros usuários).
+    'pid_fds': {},
     # Timestamp (em segundos desde a Epoch) da última coleta de dados de processos.
     # Usado para calcular o 'elapsed_wall_time' (tempo real decorrido), necessário para normalizar
     # o uso de CPU do processo (delta de tempo de CPU do processo / delta de tempo real).
     'prev_timestamp': time.time(),
-    # Cache para o total de memória RAM em KB. Evita releituras constantes do arquivo /proc/meminfo
-    # se o valor não mudou (o que é geralmente o caso para MemTotal).
-    'mem_total_kb': None,
+    # Total de memória RAM em KB, preenchido uma única vez na carga do módulo
+    # via os.sysconf (sem I/O de arquivo): MemTotal não muda em tempo de
+    # execução, então não há motivo para reler /proc/meminfo no caminho quente.
+    'mem_total_kb': os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') // 1024,
     # Armazena as últimas estatísticas de I/O do disco (total_reads_bytes, total_writes_bytes agregados de todos os discos relevantes).
     # Usado para calcular as taxas de leitura/escrita globais do disco.
     'prev_disk_stats': {},
     # Timestamp da última coleta de dados de I/O de disco. Usado para calcular o delta de tempo para as taxas de I/O.
     'prev_disk_io_timestamp': time.time(),
-    # Cache para estatísticas de I/O por processo (bytes lidos e escritos).
-    # Lidos de /proc/[pid]/io. Chave: PID (str), Valor: {'read_bytes': int, 'write_bytes': int}.
-    'prev_proc_io_stats': {},
 }
 
+
+def _get_pid_slot(pid_val):
+    """
+    Retorna o índice do slot nos arrays do cache para o PID informado,
+    alocando um slot novo (ou reaproveitando um liberado) se necessário.
+    Os arrays crescem em blocos para amortizar as realocações.
+    As chaves são PIDs inteiros: hashing de int é mais barato que de str e
+    dispensa manter a forma textual do PID no caminho quente.
+
+    Args:
+        pid_val (int): O ID do processo.
+
+    Returns:
+        int: O índice do slot. Slots recém-alocados são inicializados com
+             0 ticks (mesmo padrão do cache antigo) e com o sentinela -1 nos
+             bytes de I/O, indicando que ainda não há amostra anterior.
+    """
+    idx = cache['pid_index'].get(pid_val)
+    if idx is not None:
+        return idx
+
+    if cache['free_slots']:
+        idx = cache['free_slots'].pop()
+    else:
+        idx = cache['next_slot']
+        cache['next_slot'] += 1
+        if idx >= len(cache['prev_ticks']):
+            new_size = max(64, 2 * len(cache['prev_ticks']))
+            for key in ('prev_ticks', 'prev_read_bytes', 'prev_write_bytes', 'slot_gen'):
+                cache[key] = np.resize(cache[key], new_size)
+
+    cache['prev_ticks'][idx] = 0
+    cache['prev_read_bytes'][idx] = -1
+    cache['prev_write_bytes'][idx] = -1
+    cache['slot_gen'][idx] = cache['scan_gen']
+    cache['pid_index'][pid_val] = idx
+    return idx
+
+
+def _release_pid_slot(pid_val):
+    """
+    Libera o slot do cache associado a um PID que deixou de existir,
+    devolvendo-o à lista de slots livres para reutilização, e fecha os
+    descritores de arquivo mantidos abertos para o processo.
+    """
+    idx = cache['pid_index'].pop(pid_val, None)
+    if idx is not None:
+        cache['free_slots'].append(idx)
+
+    fds = cache['pid_fds'].pop(pid_val, None)
+    if fds is not None:
+        for fd in fds:
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+
+def read_proc_file_bytes(path, bufsize):
+    """
+    Lê um arquivo de /proc com uma única chamada read(2) sobre um descritor cru.
+    Arquivos de /proc podem mudar entre leituras parciais, e o open() em modo
+    texto do Python faz vários read() através de camadas de IO bufferizado;
+    uma leitura única e limitada devolve um snapshot consistente do kernel sem
+    alocar a pilha de objetos de buffer a cada chamada.
+
+    Args:
+        path (str): Caminho do arquivo em /proc.
+        bufsize (int): Tamanho máximo da leitura, em bytes.
+
+    Returns:
+        bytes: O conteúdo lido (até bufsize bytes).
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, bufsize)
+    finally:
+        os.close(fd)
+
+
+# Descritores persistentes dos arquivos globais de /proc relidos a cada tick
+# (/proc/stat, /proc/meminfo, /proc/diskstats): o procfs regenera o conteúdo a
+# cada leitura, então um pread(2) no offset 0 devolve um snapshot novo sem o
+# par openat()/close() por refresh. Arquivos por PID não entram aqui — seus
+# descritores vivem em cache['pid_fds'], atrelados à vida do processo.
+_global_proc_fds = {}
+
+
+def _read_global_proc_file(path, bufsize):
+    """
+    Relê um arquivo global de /proc através de um descritor aberto uma única
+    vez e mantido pelo resto da vida do processo, com um único pread(2).
+
+    Args:
+        path (str): Caminho do arquivo em /proc.
+        bufsize (int): Tamanho máximo da leitura, em bytes.
+
+    Returns:
+        bytes: O conteúdo lido (até bufsize bytes).
+    """
+    fd = _global_proc_fds.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        _global_proc_fds[path] = fd
+    return os.pread(fd, bufsize, 0)
+
+
+@atexit.register
+def _close_global_proc_fds():
+    """Fecha os descritores globais de /proc mantidos abertos pelo módulo."""
+    for fd in _global_proc_fds.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _global_proc_fds.clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def format_local_timestamp(epoch_seconds):
+    """
+    Formata um timestamp (segundos inteiros desde a Epoch) como data/hora
+    local 'dd/mm/aaaa HH:MM:SS'. Usa time.strftime/time.localtime, que são
+    chamadas diretas em C sem criar objetos datetime intermediários, e
+    memoiza o resultado: em listagens de diretório muitos arquivos
+    compartilham o mesmo segundo de modificação.
+
+    Args:
+        epoch_seconds (int): Timestamp em segundos desde a Epoch.
+
+    Returns:
+        str: A data/hora formatada.
+    """
+    return time.strftime('%d/%m/%Y %H:%M:%S', time.localtime(epoch_seconds))
+
+
+def _read_smaps_rollup(pid):
+    """
+    Lê /proc/[pid]/smaps_rollup, que traz os totais de memória do processo já
+    agregados pelo kernel, e extrai a memória compartilhada. Ao contrário de
+    /proc/[pid]/smaps, o rollup não percorre todos os mapeamentos um a um, o
+    que evita lentidão (e contenção com o próprio processo monitorado) em
+    processos com muita memória. Disponível a partir do kernel 4.14.
+
+    Args:
+        pid (int): O ID do processo.
+
+    Returns:
+        int or None: Memória compartilhada (Shared_Clean + Shared_Dirty) em KB,
+                     ou None se o rollup não estiver disponível/legível.
+    """
+    try:
+        data = read_proc_file_bytes(f'/proc/{pid}/smaps_rollup', 4096)
+    except OSError:
+        return None
+
+    shared_kb = 0
+    found = False
+    for line in data.splitlines():
+        if line.startswith(b'Shared_Clean:') or line.startswith(b'Shared_Dirty:'):
+            try:
+                shared_kb += int(line.split()[1])
+                found = True
+            except (IndexError, ValueError):
+                continue
+    return shared_kb if found else None
+
+
+def _parse_stat_name_ticks(data):
+    """
+    Parser especializado da linha de /proc/[pid]/stat: extrai apenas o nome
+    (campo 2) e utime/stime (campos 14 e 15), sem fazer split() dos ~52 campos.
+    Trabalha direto nos bytes: ancora no ')' final (o nome do processo pode
+    conter espaços e parênteses) e avança campo a campo a partir dele.
+
+    Args:
+        data (bytes): Conteúdo bruto da linha de /proc/[pid]/stat.
+
+    Returns:
+        tuple: (nome do processo (str), utime em ticks (int), stime em ticks (int)).
+    """
+    rpar = data.rfind(b')')
+    name = data[data.index(b'(') + 1:rpar].decode('utf-8', 'replace')
+
+    # O campo 3 ('state') começa 2 posições depois do ')'. Para chegar ao
+    # utime (campo 14) basta pular 11 separadores; o stime vem em seguida.
+    pos = rpar + 2
+    for _ in range(11):
+        pos = data.index(b' ', pos) + 1
+    end = data.index(b' ', pos)
+    utime = int(data[pos:end])
+    pos = end + 1
+    end = data.index(b' ', pos)
+    stime = int(data[pos:end])
+    return name, utime, stime
+
 # Constantes do sistema.
 # CLK_TCK (Clock Ticks por Segundo): Define quantos 'jiffies' (unidade básica de tempo do kernel Linux)
 # ocorrem em um segundo. O valor é tipicamente 100 em muitos sistemas Linux.
@@ -40,51 +265,129 @@ CLK_TCK = 100
 # PAGE_SIZE: Tamanho de uma página de memória em bytes. Comum em arquiteturas x86/x86_64 é 4096 bytes (4KB).
 # Usado para calcular o número de páginas de memória de um processo a partir de VmRSS, VmSize, etc. (que são em KB).
 PAGE_SIZE = 4096
+# KB_PER_PAGE: Quantos KB cabem em uma página de memória (4 para páginas de
+# 4096 bytes). Pré-computado para converter valores em KB de /proc/[pid]/status
+# em páginas com uma única divisão inteira, sem repetir o guarda PAGE_SIZE > 0.
+KB_PER_PAGE = PAGE_SIZE // 1024 if PAGE_SIZE >= 1024 else 1
 # SECTOR_SIZE: Tamanho de um setor de disco em bytes.
 # /proc/diskstats reporta I/O em número de setores (geralmente 512 bytes por setor).
 # Usado para converter o número de setores lidos/escritos em bytes.
 SECTOR_SIZE = 512
 
+# Horário de boot do sistema (campo btime de /proc/stat), em segundos desde a
+# Epoch. O valor é invariante durante toda a vida do sistema, então é lido uma
+# única vez na carga do módulo em vez de reler /proc/stat inteiro a cada
+# chamada de get_process_details. Fica 0 se não puder ser determinado.
+try:
+    SYSTEM_BOOT_TIME_EPOCH = next(
+        int(line.split()[1])
+        for line in read_proc_file_bytes('/proc/stat', 65536).splitlines()
+        if line.startswith(b'btime')
+    )
+except (OSError, StopIteration, ValueError):
+    SYSTEM_BOOT_TIME_EPOCH = 0
+
+# Regex compilada que casa apenas nomes de discos inteiros em /proc/diskstats
+# (sda, vdb, nvme0n1, ...), excluindo partições (sda1, nvme0n1p1) e dispositivos
+# irrelevantes (sr*, loop*, ram*, dm-*). Substitui o laço aninhado de prefixos
+# por um único teste por linha.
+_WHOLE_DISK = re.compile(rb'^(?:sd[a-z]+|hd[a-z]+|vd[a-z]+|xvd[a-z]+|nvme\d+n\d+)$')
+
+# Marcadores usados para localizar os campos de interesse em /proc/[pid]/io.
+# O arquivo tem apenas 7 linhas curtas, então uma única leitura seguida de
+# buscas com find() é mais barata do que iterar linha a linha para cada PID.
+# Mantidos como bytes para evitar o decode do conteúdo lido.
+_IO_READ_MARKER = b'read_bytes: '
+_IO_WRITE_MARKER = b'\nwrite_bytes: '
+
+# Regex compilada que captura de /proc/meminfo apenas as chaves que o dashboard
+# usa. Um findall sobre os bytes do arquivo substitui o laço Python que fazia
+# split(':')/int() em todas as ~50 linhas a cada tick.
+_MEMINFO_RE = re.compile(rb'^(MemTotal|MemAvailable|MemFree|SwapTotal|SwapFree):\s+(\d+)', re.M)
+
 # Cache para mapeamento de UID (User ID) para nome de usuário.
 # Evita ler e parsear /etc/passwd repetidamente para o mesmo UID.
-_user_cache = {}
+# O sentinela -1 (UID não encontrado) já nasce cacheado como 'N/A', então o
+# caminho quente pode chamar a função de resolução incondicionalmente.
+_user_cache = {-1: 'N/A'}
+
+# Caminho rápido da resolução de UID no laço de consolidação: uma lista plana
+# indexada pelo próprio UID troca hash de dict + chamada de função por uma
+# indexação de lista para os UIDs comuns (< 65536). Slots são aquecidos na
+# primeira vez que o UID aparece; UIDs fora da faixa (inclusive o sentinela
+# -1) caem na função memoizada de sempre.
+_USER_FAST_MAX = 65536
+_user_fast = [None] * _USER_FAST_MAX
+
+# Memo curto da enumeração de PIDs: get_global_info e get_processes_info rodam
+# em sequência dentro do mesmo refresh e cada uma varria /proc por conta
+# própria. A lista é enumerada uma vez e reutilizada dentro da janela abaixo,
+# cortando o segundo getdents64 por tick sem risco de servir dados velhos
+# entre refreshes (o intervalo de atualização é de segundos).
+_PID_LIST_TTL_SECONDS = 0.5
+_pid_list_memo = (-_PID_LIST_TTL_SECONDS, [])
+
+# Descritor do diretório /proc aberto uma única vez na carga do módulo: as
+# aberturas por PID usam openat(2) relativas a ele (dir_fd), poupando o kernel
+# de resolver o prefixo '/proc' a cada open no laço quente. -1 desativa o
+# atalho (os opens voltam a usar o caminho absoluto).
+try:
+    _PROC_DIRFD = os.open('/proc', os.O_RDONLY | os.O_DIRECTORY)
+except OSError:
+    _PROC_DIRFD = -1
+
+# Pool de threads persistente para a leitura por PID: o trabalho por processo
+# é dominado por syscalls de leitura em /proc, que soltam a GIL, então os
+# preads de vários PIDs se sobrepõem no kernel em vez de serializar no
+# interpretador. Definir como None desativa o paralelismo (a coleta degrada
+# para um map serial no chamador).
+_SCAN_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='proc-scan')
+
+def _list_pid_names():
+    """
+    Enumera os diretórios de processo de /proc (nomes que começam com dígito)
+    com os.scandir, sem o stat() extra de is_dir(), memoizando o resultado por
+    uma janela curta para compartilhar a enumeração entre as coletas do mesmo
+    refresh.
+
+    Returns:
+        list[str]: Os nomes (PIDs em texto) dos diretórios de processo.
+    """
+    global _pid_list_memo
+    ts, names = _pid_list_memo
+    now = time.monotonic()
+    if now - ts < _PID_LIST_TTL_SECONDS:
+        return names
+    with os.scandir('/proc') as proc_it:
+        names = [entry.name for entry in proc_it if entry.name[0].isdigit()]
+    _pid_list_memo = (now, names)
+    return names
 
 def get_username_from_uid_local(uid_int):
     """
-    Obtém o nome de usuário correspondente a um UID (User ID) lendo o arquivo /etc/passwd.
-    Utiliza um cache interno (`_user_cache`) para otimizar chamadas repetidas para o mesmo UID,
-    reduzindo operações de I/O de arquivo.
+    Obtém o nome de usuário correspondente a um UID (User ID) via pwd.getpwuid,
+    que consulta a libc/nsswitch em uma única chamada em C, em vez de varrer
+    /etc/passwd linha a linha em Python a cada UID novo. Utiliza um cache
+    interno (`_user_cache`) para otimizar chamadas repetidas para o mesmo UID.
 
     Args:
         uid_int (int): O ID do usuário (numérico).
 
     Returns:
-        str: O nome de usuário correspondente. Se não for encontrado ou em caso de erro
-             (ex: /etc/passwd não encontrado), retorna o UID convertido para string.
+        str: O nome de usuário correspondente. Se não for encontrado ou em caso
+             de erro, retorna o UID convertido para string.
     """
     # Retorna do cache se já presente.
     if uid_int in _user_cache:
         return _user_cache[uid_int]
 
     try:
-        # Lê /etc/passwd para encontrar o nome de usuário pelo UID.
-        with open('/etc/passwd', 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.strip().split(':')
-                if len(parts) > 2:
-                    try:
-                        if int(parts[2]) == uid_int:
-                            username = parts[0]
-                            _user_cache[uid_int] = username # Adiciona ao cache.
-                            return username
-                    except ValueError:
-                        continue
-    except FileNotFoundError:
-        _user_cache[uid_int] = str(uid_int)
-        return str(uid_int)
+        username = pwd.getpwuid(uid_int).pw_name
+    except (KeyError, OSError):
+        username = str(uid_int)
 
-    _user_cache[uid_int] = str(uid_int)
-    return str(uid_int)
+    _user_cache[uid_int] = username # Adiciona ao cache.
+    return username
 
 
 def get_global_info():
@@ -107,9 +410,11 @@ def get_global_info():
     cpu_used_pct = 0.0
     cpu_ocioso_pct = 0.0
     try:
-        with open('/proc/stat', 'r') as f:
-            line = f.readline()
-            fields = list(map(int, line.split()[1:]))
+        stat_head = _read_global_proc_file('/proc/stat', 8192)
+        line = stat_head[:stat_head.index(b'\n')]
+        # Split único com a fatia limitada aos 8 campos numéricos de interesse
+        # (user..steal); nada de re-somar subconjuntos dos campos depois.
+        fields = [int(x) for x in line.split()[1:9]]
 
         current_ocioso = fields[3] + fields[4] # idle + iowait
         current_total = sum(fields)
@@ -120,18 +425,16 @@ def get_global_info():
         if prev_total > 0 and current_total > prev_total:
             total_diff = current_total - prev_total
             ocioso_diff = current_ocioso - prev_ocioso
-            cpu_used_pct = (1.0 - (ocioso_diff / total_diff)) * 100 if total_diff > 0 else 0.0
-            cpu_ocioso_pct = (ocioso_diff / total_diff) * 100 if total_diff > 0 else 0.0
-        else:
-            non_ocioso_time = fields[0] + fields[1] + fields[2] + fields[5] + fields[6] + fields[7]
-            cpu_used_pct = (non_ocioso_time / current_total) * 100 if current_total > 0 else 0.0
-            cpu_ocioso_pct = (fields[3] / current_total * 100) if current_total > 0 else 0.0
+            cpu_used_pct = (1.0 - (ocioso_diff / total_diff)) * 100
+            cpu_ocioso_pct = (ocioso_diff / total_diff) * 100
+        # Sem amostra anterior (primeira coleta) os percentuais ficam em 0.0:
+        # apenas semeia o cache e o valor real aparece no próximo tick.
 
         cache['prev_sys_cpu_times']['ocioso'] = current_ocioso
         cache['prev_sys_cpu_times']['total'] = current_total
 
     except (FileNotFoundError, IndexError, ValueError, ZeroDivisionError) as e:
-        print(f"Erro ao ler /proc/stat: {e}")
+        log.debug(f"Erro ao ler /proc/stat: {e}")
 
     # --- Cálculo do Uso da Memória RAM e SWAP ---
     # Lê /proc/meminfo para obter informações detalhadas sobre a memória.
@@ -143,16 +446,16 @@ def get_global_info():
     swap_used_kb = 0
 
     try:
-        meminfo = {}
-        with open('/proc/meminfo', 'r') as f:
-            for line in f:
-                chave, valor_str_com_unidade = line.split(':', 1)
-                meminfo[chave.strip()] = int(valor_str_com_unidade.split()[0])
+        # Extrai só as chaves de interesse com a regex compilada; os valores
+        # só viram int nas entradas capturadas.
+        meminfo_data = _read_global_proc_file('/proc/meminfo', 8192)
+        meminfo = {chave: int(valor) for chave, valor in _MEMINFO_RE.findall(meminfo_data)}
 
-        total_mem_kb = meminfo.get('MemTotal', 1)
-        avail_mem_kb = meminfo.get('MemAvailable', meminfo.get('MemFree', 0))
+        total_mem_kb = meminfo.get(b'MemTotal', 1)
+        avail_mem_kb = meminfo.get(b'MemAvailable', meminfo.get(b'MemFree', 0))
 
-        if cache['mem_total_kb'] is None or cache['mem_total_kb'] != total_mem_kb:
+        # Alinha o valor semeado na carga do módulo com o MemTotal reportado pelo kernel.
+        if cache['mem_total_kb'] != total_mem_kb:
              cache['mem_total_kb'] = total_mem_kb
 
         if total_mem_kb > 0:
@@ -160,32 +463,34 @@ def get_global_info():
             mem_free_pct = (avail_mem_kb / total_mem_kb) * 100
             mem_used_absolute_kb = total_mem_kb - avail_mem_kb
 
-        swap_total_kb = meminfo.get('SwapTotal', 0)
-        swap_free_kb = meminfo.get('SwapFree', 0)
+        swap_total_kb = meminfo.get(b'SwapTotal', 0)
+        swap_free_kb = meminfo.get(b'SwapFree', 0)
         swap_used_kb = swap_total_kb - swap_free_kb
 
     except (FileNotFoundError, ValueError, ZeroDivisionError) as e:
-        print(f"Erro ao ler /proc/meminfo: {e}")
+        log.debug(f"Erro ao ler /proc/meminfo: {e}")
         mem_used_pct = 0.0
         mem_free_pct = 0.0
         mem_used_absolute_kb = 0
         swap_used_kb = 0
 
     # --- Contagem de Processos e Threads Totais no Sistema ---
-    # Itera sobre os diretórios em /proc para contar PIDs e threads.
-    proc_count = 0
+    # Itera sobre os diretórios de processo para contar PIDs e threads,
+    # reutilizando a enumeração compartilhada do refresh (ver _list_pid_names).
     thread_count_global = 0
-    for proc_dir_global in Path('/proc').iterdir():
-        if proc_dir_global.is_dir() and proc_dir_global.name.isdigit():
-            proc_count += 1
-            try:
-                with open(proc_dir_global / 'status', 'r') as sf_global:
-                    for line_global in sf_global:
-                        if line_global.startswith('Threads:'):
-                            thread_count_global += int(line_global.split()[1])
-                            break
-            except (FileNotFoundError, PermissionError, ValueError):
-                continue
+    pid_names = _list_pid_names()
+    proc_count = len(pid_names)
+    for pid_name in pid_names:
+        try:
+            # Bytes crus e um find() direto no campo: sem decodificar para str
+            # nem iterar linha a linha só para achar 'Threads:'.
+            status_data = read_proc_file_bytes(f'/proc/{pid_name}/status', 4096)
+            pos = status_data.find(b'\nThreads:')
+            if pos != -1:
+                pos += len(b'\nThreads:')
+                thread_count_global += int(status_data[pos:status_data.find(b'\n', pos)])
+        except (OSError, ValueError):
+            continue
 
     # --- Cálculo de I/O de Disco ---
     # Lê /proc/diskstats para obter estatísticas de I/O acumuladas dos discos.
@@ -194,39 +499,26 @@ def get_global_info():
     current_aggregated_reads_bytes = 0
     current_aggregated_writes_bytes = 0
 
-    # Define prefixos de dispositivos de disco relevantes para filtragem.
-    relevant_device_prefixes = ('sd', 'hd', 'vd', 'xvd')
-    nvme_prefix = 'nvme'
-
     try:
-        with open('/proc/diskstats', 'r') as f:
-            for line in f:
+        # Leitura única em bytes: os campos numéricos convertem direto de
+        # bytes com int(), sem validação UTF-8 nem objetos str por linha.
+        for line in _read_global_proc_file('/proc/diskstats', 65536).split(b'\n'):
                 fields = line.split()
                 if len(fields) < 10: continue
                 device_name = fields[2]
 
-                is_relevant = False
-                for prefix in relevant_device_prefixes:
-                    if device_name.startswith(prefix) and not any(char.isdigit() for char in device_name[len(prefix):]):
-                        is_relevant = True
-                        break
-                if not is_relevant and device_name.startswith(nvme_prefix) and 'p' not in device_name[len(nvme_prefix):]:
-                    is_relevant = True
-
-                if device_name.startswith(('sr', 'loop', 'ram', 'dm-')):
-                    is_relevant = False
-
-                if is_relevant:
+                # O teste de relevância inteiro é um único match da regex compilada.
+                if _WHOLE_DISK.match(device_name):
                     try:
                         sectors_read = int(fields[5])
                         sectors_written = int(fields[9])
                         current_aggregated_reads_bytes += sectors_read * SECTOR_SIZE
                         current_aggregated_writes_bytes += sectors_written * SECTOR_SIZE
                     except ValueError:
-                        print(f"Aviso: Não foi possível parsear dados de I/O para o dispositivo {device_name}")
+                        log.debug(f"Aviso: Não foi possível parsear dados de I/O para o dispositivo {device_name}")
                         continue
-    except (FileNotFoundError, IndexError) as e:
-        print(f"Erro ao leer ou processar /proc/diskstats: {e}")
+    except (OSError, IndexError) as e:
+        log.debug(f"Erro ao leer ou processar /proc/diskstats: {e}")
 
     # Calcula as taxas de I/O (bytes por segundo) usando a diferença entre as leituras.
     elapsed_disk_io_time = current_timestamp - cache.get('prev_disk_io_timestamp', current_timestamp - 1.0)
@@ -261,6 +553,109 @@ def get_global_info():
         "Escrita Disco (B/s)": round(max(0, disk_write_bps), 2)
     }
 
+def _read_proc_pid(pid_str):
+    """
+    Lê e parseia /proc/[pid]/{stat,status,io} para um único PID. Função alvo
+    do pool de threads da coleta: contém apenas leituras (os syscalls soltam a
+    GIL) e parse de bytes, sem tocar na contabilidade de slots do cache, que
+    permanece serial em get_processes_info.
+
+    Args:
+        pid_str (str): O PID em texto, como enumerado de /proc.
+
+    Returns:
+        tuple or None: (pid, nome, uid, threads, rss_kb, ticks_totais,
+                        read_bytes, write_bytes), ou None se o processo sumiu
+                        ou não pôde ser lido — nesse caso o slot do PID é
+                        recolhido pela limpeza de obsoletos do tick.
+    """
+    pid_val = int(pid_str)
+    try:
+        # Reaproveita os descritores abertos em ticks anteriores; para um PID
+        # novo, abre os três arquivos com openat(2) relativo ao descritor de
+        # /proc quando disponível, sem resolver o prefixo a cada open.
+        fds = cache['pid_fds'].get(pid_val)
+        if fds is None:
+            if _PROC_DIRFD >= 0:
+                base, dfd = pid_str, _PROC_DIRFD
+            else:
+                base, dfd = f'/proc/{pid_str}', None
+            stat_fd = os.open(f'{base}/stat', os.O_RDONLY, dir_fd=dfd)
+            try:
+                status_fd = os.open(f'{base}/status', os.O_RDONLY, dir_fd=dfd)
+            except OSError:
+                os.close(stat_fd)
+                raise
+            try:
+                io_fd = os.open(f'{base}/io', os.O_RDONLY, dir_fd=dfd)
+            except OSError:
+                io_fd = -1 # Sem permissão (ou sem o arquivo): I/O fica zerado.
+            fds = (stat_fd, status_fd, io_fd)
+            cache['pid_fds'][pid_val] = fds
+
+        # --- Leitura de /proc/[pid]/stat para tempo de CPU e nome ---
+        stat_data = os.pread(fds[0], 4096, 0)
+        name, utime_ticks, stime_ticks = _parse_stat_name_ticks(stat_data)
+
+        # --- Leitura de /proc/[pid]/status para UID, memória e threads ---
+        # Varredura única sobre os bytes crus, sem decode: uma máscara marca
+        # os três campos de interesse e o laço para assim que todos foram
+        # encontrados (VmRSS não existe em threads de kernel; nesse caso a
+        # varredura apenas chega ao fim).
+        uid_int = -1
+        mem_kb_val = 0
+        num_threads = 0
+        status_data = os.pread(fds[1], 4096, 0)
+        found = 0
+        for line in status_data.split(b'\n'):
+            if line.startswith(b'Uid:'):
+                uid_int = int(line.split()[1])
+                found |= 1
+            elif line.startswith(b'Threads:'):
+                num_threads = int(line.split()[1])
+                found |= 2
+            elif line.startswith(b'VmRSS:'):
+                mem_kb_val = int(line.split()[1])
+                found |= 4
+            if found == 0b111:
+                break
+
+        # --- Leitura de I/O por processo (/proc/[pid]/io) ---
+        # O sentinela -1 marca leitura indisponível (sem permissão ou falha
+        # transitória); a máscara vetorizada do chamador força delta zero
+        # nesses casos, como na primeira amostra de um slot.
+        current_proc_read_bytes = -1
+        current_proc_write_bytes = -1
+        try:
+            # Relê o arquivo pelo descritor já aberto com um único pread(2)
+            # (nunca passa de 256 bytes) e localiza os dois campos de
+            # interesse com find(), sem open()/close() nem iteração por linha.
+            if fds[2] >= 0:
+                io_data = os.pread(fds[2], 256, 0)
+
+                pos = io_data.find(_IO_READ_MARKER)
+                if pos != -1:
+                    current_proc_read_bytes = int(io_data[pos + len(_IO_READ_MARKER):io_data.find(b'\n', pos)])
+                pos = io_data.find(_IO_WRITE_MARKER)
+                if pos != -1:
+                    current_proc_write_bytes = int(io_data[pos + len(_IO_WRITE_MARKER):io_data.find(b'\n', pos + 1)])
+        except (OSError, ValueError):
+            pass # Ignora se o arquivo não existe ou não tem permissão.
+
+        return (pid_val, name, uid_int, num_threads, mem_kb_val,
+                utime_ticks + stime_ticks,
+                current_proc_read_bytes, current_proc_write_bytes)
+
+    except (OSError, IndexError, ValueError):
+        # O processo morreu (e o PID pode ter sido reutilizado) ou não é
+        # legível: o slot e os descritores são recolhidos pela limpeza do
+        # tick; um eventual novo ocupante do PID é coletado no próximo.
+        return None
+    except Exception as e:
+        log.debug(f"Erro inesperado ao processar PID {pid_str}: {e}")
+        return None
+
+
 def get_processes_info(limit=10):
     """
     Coleta informações sobre os processos em execução no sistema.
@@ -286,159 +681,188 @@ def get_processes_info(limit=10):
     elapsed_wall_time = now - cache.get('prev_timestamp', now - 1.0)
     if elapsed_wall_time <= 0.001: elapsed_wall_time = 1.0
 
-    # Garante que o total de memória RAM esteja no cache para cálculos de porcentagem.
-    if cache['mem_total_kb'] is None:
-        try:
-            with open('/proc/meminfo', 'r') as f:
-                for line in f:
-                    if line.startswith('MemTotal:'):
-                        cache['mem_total_kb'] = int(line.split()[1])
-                        break
-        except (FileNotFoundError, ValueError):
-            cache['mem_total_kb'] = 1
-
+    # O total de memória RAM já está no cache desde a carga do módulo.
     mem_total_kb = cache.get('mem_total_kb', 1)
     if mem_total_kb == 0: mem_total_kb = 1
 
-    active_pids_this_run = set() # Rastreia PIDs ativos nesta execução para limpeza do cache.
-
-    # Itera sobre os diretórios de processo em /proc.
-    for proc_dir in Path('/proc').iterdir():
-        if not (proc_dir.is_dir() and proc_dir.name.isdigit()): continue
-
-        pid_str = proc_dir.name
-        pid_val = int(pid_str)
-        active_pids_this_run.add(pid_str)
-
-        try:
-            # --- Leitura de /proc/[pid]/stat para tempo de CPU e nome ---
-            with open(proc_dir / 'stat', 'r') as sf:
-                vals = sf.readline().split()
-
-            name = vals[1].strip('()')
-            utime_ticks = int(vals[13])
-            stime_ticks = int(vals[14])
-            current_proc_total_ticks = utime_ticks + stime_ticks
-
-            # --- Leitura de /proc/[pid]/status para UID, memória e threads ---
-            uid_int = -1
-            mem_kb_val = 0
-            num_threads = 0
-            try:
-                with open(proc_dir / 'status', 'r') as sf_status:
-                    for line in sf_status:
-                        if line.startswith('Uid:'): uid_int = int(line.split()[1])
-                        elif line.startswith('VmRSS:'):
-                            mem_kb_str = line.split()[1]
-                            mem_kb_val = int(mem_kb_str) if mem_kb_str.isdigit() else 0
-                        elif line.startswith('Threads:'): num_threads = int(line.split()[1])
-            except FileNotFoundError:
-                # Se o processo sumiu, remove do cache e pula.
-                if pid_str in cache['prev_times']: del cache['prev_times'][pid_str]
-                if pid_str in cache['prev_proc_io_stats']: del cache['prev_proc_io_stats'][pid_str]
-                continue
-
-            username = get_username_from_uid_local(uid_int) if uid_int != -1 else 'N/A'
-
-            # --- Cálculo da porcentagem de CPU usada pelo processo ---
-            prev_proc_ticks = cache['prev_times'].get(pid_str, 0)
-            cpu_time_diff_seconds = (current_proc_total_ticks - prev_proc_ticks) / CLK_TCK
-            cpu_pct = (cpu_time_diff_seconds / elapsed_wall_time) * 100
-
-            # --- Cálculo do uso de memória pelo processo ---
-            mem_mb = mem_kb_val / 1024.0
-            mem_pct = (mem_kb_val / mem_total_kb) * 100.0 if mem_total_kb > 0 else 0.0
-
-            cpu_time_seconds = current_proc_total_ticks / CLK_TCK
-
-            # Atualiza o cache de ticks de CPU do processo.
-            cache['prev_times'][pid_str] = current_proc_total_ticks
-
-            # --- Cálculo de I/O por processo (leitura de /proc/[pid]/io) ---
-            io_read_bps = 0.0
-            io_write_bps = 0.0
-            try:
-                with open(proc_dir / 'io', 'r') as f_io:
-                    current_proc_read_bytes = 0
-                    current_proc_write_bytes = 0
-                    for line in f_io:
-                        if line.startswith('read_bytes:'): current_proc_read_bytes = int(line.split()[1])
-                        elif line.startswith('write_bytes:'): current_proc_write_bytes = int(line.split()[1])
-
-                prev_io_stats_for_pid = cache['prev_proc_io_stats'].get(pid_str)
-                if prev_io_stats_for_pid:
-                    read_bytes_diff = current_proc_read_bytes - prev_io_stats_for_pid['read_bytes']
-                    write_bytes_diff = current_proc_write_bytes - prev_io_stats_for_pid['write_bytes']
-                    io_read_bps = read_bytes_diff / elapsed_wall_time if elapsed_wall_time > 0 else 0
-                    io_write_bps = write_bytes_diff / elapsed_wall_time if elapsed_wall_time > 0 else 0
-
-                # Atualiza o cache de I/O do processo.
-                cache['prev_proc_io_stats'][pid_str] = {
-                    'read_bytes': current_proc_read_bytes,
-                    'write_bytes': current_proc_write_bytes,
-                }
-            except (FileNotFoundError, PermissionError, ValueError):
-                pass # Ignora se o arquivo não existe ou não tem permissão.
-
-            processes.append({
-                'pid': pid_val,
-                'name': name,
-                'username': username,
-                'threads': num_threads,
-                'cpu_percent': round(max(0, cpu_pct), 2),
-                'memory_mb': round(mem_mb, 2),
-                'memory_percent': round(mem_pct, 2),
-                'cpu_time': round(cpu_time_seconds, 2),
-                'io_read_bps': round(max(0, io_read_bps), 2),
-                'io_write_bps': round(max(0, io_write_bps), 2)
-            })
-
-        except FileNotFoundError:
-            # Limpa o cache se o processo desapareceu.
-            if pid_str in cache['prev_times']: del cache['prev_times'][pid_str]
-            if pid_str in cache['prev_proc_io_stats']: del cache['prev_proc_io_stats'][pid_str]
-            continue
-        except (PermissionError, IndexError, ValueError) as e:
-            print(f"Erro ao processar dados básicos do PID {pid_str}: {e}")
-            # Limpa o cache em caso de erro na leitura.
-            if pid_str in cache['prev_times']: del cache['prev_times'][pid_str]
-            if pid_str in cache['prev_proc_io_stats']: del cache['prev_proc_io_stats'][pid_str]
-            continue
-        except Exception as e:
-            print(f"Erro inesperado ao processar PID {pid_str}: {e}")
-            # Limpa o cache em caso de erro genérico.
-            if pid_str in cache['prev_times']: del cache['prev_times'][pid_str]
-            if pid_str in cache['prev_proc_io_stats']: del cache['prev_proc_io_stats'][pid_str]
+    # Geração desta varredura: slots vistos agora recebem este carimbo e a
+    # limpeza ao final libera os que ficaram com um carimbo antigo.
+    scan_gen = cache['scan_gen'] + 1
+    cache['scan_gen'] = scan_gen
+
+    # Valores brutos coletados por PID, em listas paralelas. A aritmética
+    # (CPU%, memória, taxas de I/O) é feita em lote com NumPy depois do laço,
+    # em vez de ~10 operações escalares no interpretador para cada processo.
+    pids = []
+    names = []
+    usernames = []
+    thread_counts = []
+    slots_list = []
+    curr_ticks_list = []
+    rss_kb_list = []
+    read_bytes_list = []
+    write_bytes_list = []
+
+    # Liga a nomes locais as referências usadas a cada iteração: no CPython,
+    # consultas a globais e a atributos (como list.append) custam mais do que
+    # acesso a variáveis locais, e este laço roda uma vez por PID por tick.
+    get_pid_slot = _get_pid_slot
+    get_username = get_username_from_uid_local
+    user_fast = _user_fast
+    user_fast_max = _USER_FAST_MAX
+    pids_append = pids.append
+    names_append = names.append
+    usernames_append = usernames.append
+    thread_counts_append = thread_counts.append
+    slots_append = slots_list.append
+    curr_ticks_append = curr_ticks_list.append
+    rss_kb_append = rss_kb_list.append
+    read_bytes_append = read_bytes_list.append
+    write_bytes_append = write_bytes_list.append
+
+    # Dispara a leitura por PID no pool de threads, reutilizando a enumeração
+    # do refresh atual (ver _list_pid_names): as leituras de vários PIDs se
+    # sobrepõem no kernel. A consolidação abaixo — slots, usernames e listas
+    # paralelas — continua serial, preservando a contabilidade do cache.
+    if _SCAN_POOL is not None:
+        results = _SCAN_POOL.map(_read_proc_pid, _list_pid_names(), chunksize=32)
+    else:
+        results = map(_read_proc_pid, _list_pid_names())
+
+    for rec in results:
+        if rec is None:
             continue
-
-    # --- Limpeza do cache: remove PIDs de processos que não existem mais ---
-    # Identifica e remove do cache PIDs que não foram encontrados na varredura atual.
-    stale_cpu_pids = set(cache['prev_times'].keys()) - active_pids_this_run
-    for stale_pid in stale_cpu_pids:
-        if stale_pid in cache['prev_times']: del cache['prev_times'][stale_pid]
-
-    stale_io_pids = set(cache['prev_proc_io_stats'].keys()) - active_pids_this_run
-    for stale_pid in stale_io_pids:
-        if stale_pid in cache['prev_proc_io_stats']: del cache['prev_proc_io_stats'][stale_pid]
+        pid_val, name, username_uid, num_threads, mem_kb_val, total_ticks, rd_bytes, wr_bytes = rec
+        pids_append(pid_val)
+        names_append(name)
+        # Caminho rápido por lista plana para UIDs comuns; o caso uid == -1
+        # cai na função e já está semeado no cache como 'N/A'.
+        if 0 <= username_uid < user_fast_max:
+            username = user_fast[username_uid]
+            if username is None:
+                username = get_username(username_uid)
+                user_fast[username_uid] = username
+        else:
+            username = get_username(username_uid)
+        usernames_append(username)
+        thread_counts_append(num_threads)
+        # Localiza (ou aloca) o slot do PID nos arrays do cache; os valores
+        # anteriores são coletados (gather) e os atuais gravados (scatter) em
+        # lote, por indexação avançada, depois do laço.
+        slots_append(get_pid_slot(pid_val))
+        curr_ticks_append(total_ticks)
+        rss_kb_append(mem_kb_val)
+        read_bytes_append(rd_bytes)
+        write_bytes_append(wr_bytes)
+
+    # Carimba os slots vistos nesta varredura com a geração atual, em um
+    # único scatter vetorizado.
+    slots_arr = np.asarray(slots_list, dtype=np.intp)
+    if len(slots_arr):
+        cache['slot_gen'][slots_arr] = scan_gen
+
+    # --- Limpeza do cache: libera slots de PIDs que não existem mais ---
+    # Compara as gerações de todos os slots indexados em lote; só os que
+    # ficaram com carimbo antigo passam pelo caminho escalar de liberação.
+    pid_index = cache['pid_index']
+    if pid_index:
+        cached_pids = list(pid_index.keys())
+        cached_slots = np.fromiter(pid_index.values(), dtype=np.intp, count=len(cached_pids))
+        for k in np.flatnonzero(cache['slot_gen'][cached_slots] != scan_gen):
+            _release_pid_slot(cached_pids[k])
 
     # Atualiza o timestamp da última coleta de processos.
     cache['prev_timestamp'] = now
 
-    # Ordena os processos pelo tempo de CPU acumulado e limita a lista.
-    processes.sort(key=lambda x: x.get('cpu_time', 0), reverse=True)
-    return processes[:limit]
+    # --- Aritmética em lote (NumPy) sobre os valores brutos coletados ---
+    # Uma passada vetorizada substitui os cálculos escalares por PID.
+    if pids:
+        curr_ticks = np.asarray(curr_ticks_list, dtype=np.int64)
+        rss_kb = np.asarray(rss_kb_list, dtype=np.int64)
+        read_bytes_arr = np.asarray(read_bytes_list, dtype=np.int64)
+        write_bytes_arr = np.asarray(write_bytes_list, dtype=np.int64)
+
+        # Gather/scatter dos valores do tick anterior com indexação avançada:
+        # uma operação por coluna substitui os três acessos escalares ao array
+        # que cada PID fazia dentro do laço.
+        prev_ticks = cache['prev_ticks'][slots_arr]
+        cache['prev_ticks'][slots_arr] = curr_ticks
+
+        prev_read_bytes_arr = cache['prev_read_bytes'][slots_arr]
+        prev_write_bytes_arr = cache['prev_write_bytes'][slots_arr]
+        # Sem amostra anterior (sentinela -1 do slot) ou leitura atual
+        # indisponível (-1): o anterior assume o atual, forçando delta zero.
+        io_invalid = (prev_read_bytes_arr < 0) | (read_bytes_arr < 0)
+        prev_read_bytes_arr = np.where(io_invalid, read_bytes_arr, prev_read_bytes_arr)
+        prev_write_bytes_arr = np.where(io_invalid, write_bytes_arr, prev_write_bytes_arr)
+        cache['prev_read_bytes'][slots_arr] = read_bytes_arr
+        cache['prev_write_bytes'][slots_arr] = write_bytes_arr
+
+        # Recíprocos e fatores de escala invariantes do tick, calculados uma
+        # única vez: multiplicar por um recíproco pré-computado é mais barato
+        # que dividir elemento a elemento, e dispensa os guardas de divisão
+        # espalhados pelos cálculos.
+        inv_elapsed = 1.0 / elapsed_wall_time
+        cpu_pct_scale = (100.0 / CLK_TCK) * inv_elapsed
+        mem_pct_scale = 100.0 / mem_total_kb
+
+        # Seleção dos top-'limit' no nível C, direto nas colunas: argpartition
+        # separa os maiores ticks acumulados em O(N) (equivale a selecionar
+        # por tempo de CPU, já que tempo = ticks / CLK_TCK) e só esse punhado
+        # de linhas é de fato ordenado — O(N log N) vira O(N + limit log
+        # limit). Apenas os índices selecionados saem do formato colunar.
+        n_procs = len(curr_ticks)
+        if limit < n_procs:
+            top = np.argpartition(curr_ticks, n_procs - limit)[n_procs - limit:]
+            top.sort() # Mantém os empates em ordem de índice, como antes.
+            order = top[np.argsort(-curr_ticks[top], kind='stable')]
+        else:
+            order = np.argsort(-curr_ticks, kind='stable')
+
+        # As derivadas (percentuais e taxas) são calculadas apenas para as
+        # linhas selecionadas, não para a tabela inteira. Os valores ficam
+        # crus (sem arredondar): casas decimais são preocupação de exibição e
+        # a view já formata cada coluna numérica com :.1f/:.2f ao renderizar.
+        cpu_pct = np.maximum(0.0, (curr_ticks[order] - prev_ticks[order]) * cpu_pct_scale)
+        mem_mb = rss_kb[order] * (1.0 / 1024.0)
+        mem_pct = rss_kb[order] * mem_pct_scale
+        cpu_time_seconds = curr_ticks[order] * (1.0 / CLK_TCK)
+        io_read_bps = np.maximum(0.0, (read_bytes_arr[order] - prev_read_bytes_arr[order]) * inv_elapsed)
+        io_write_bps = np.maximum(0.0, (write_bytes_arr[order] - prev_write_bytes_arr[order]) * inv_elapsed)
+
+        # Dicts novos a cada tick: os registros escapam no snapshot publicado
+        # e podem ficar retidos por leitores por tempo indeterminado (ex.: o
+        # fragment de detalhes numa aba em segundo plano), então reutilizar
+        # buffers aqui produziria registros rasgados. São só 'limit' dicts
+        # pequenos por coleta — custo desprezível frente à varredura de /proc.
+        for i, idx in enumerate(order):
+            processes.append({
+                'pid': pids[idx],
+                'name': names[idx],
+                'username': usernames[idx],
+                'threads': thread_counts[idx],
+                'cpu_percent': float(cpu_pct[i]),
+                'memory_mb': float(mem_mb[i]),
+                'memory_percent': float(mem_pct[i]),
+                'cpu_time': float(cpu_time_seconds[i]),
+                'io_read_bps': float(io_read_bps[i]),
+                'io_write_bps': float(io_write_bps[i]),
+            })
+
+    return processes
 
 def _parse_kb_value_from_status_line(value_str_with_unit):
     """
     Função auxiliar para converter uma string de memória (ex: '  123 kB')
     lida do arquivo /proc/[pid]/status para um valor inteiro em Kilobytes (KB).
     """
-    if isinstance(value_str_with_unit, str) and "kb" in value_str_with_unit.lower():
-        try:
-            return int(value_str_with_unit.lower().replace("kb", "").strip())
-        except ValueError:
-            return 0
-    return 0
+    # Os campos Vm* de /proc/[pid]/status vêm sempre no formato '<n> kB':
+    # converter o primeiro token basta, sem criar as cópias intermediárias de
+    # lower()/replace()/strip() a cada chamada.
+    try:
+        return int(value_str_with_unit.split(None, 1)[0])
+    except (AttributeError, IndexError, ValueError):
+        return 0
 
 def get_process_open_files(pid):
     """
@@ -456,51 +880,64 @@ def get_process_open_files(pid):
               Retorna uma lista vazia em caso de erro ou se o diretório não existir.
     """
     open_files = []
-    fd_dir = Path(f"/proc/{pid}/fd") # Caminho para o diretório de descritores de arquivo do processo.
-
-    if not fd_dir.is_dir(): return open_files # Retorna vazio se o diretório não existe.
+    fd_dir = f"/proc/{pid}/fd" # Caminho para o diretório de descritores de arquivo do processo.
 
+    # Lista os nomes das entradas (os números dos descritores) de uma vez, com
+    # caminhos montados por f-string: nada de objetos Path por descritor.
     try:
-        for fd_entry in fd_dir.iterdir(): # Itera sobre as entradas no diretório /proc/[pid]/fd.
-            try:
-                fd = fd_entry.name # O nome da entrada é o número do descritor de arquivo.
-                real_path = os.readlink(str(fd_entry)) # Resolve o link simbólico para o caminho real.
-
-                # Determina o tipo de recurso com base no caminho real.
-                resource_type = "arquivo"
-                if real_path.startswith("socket:"): resource_type = "socket"
-                elif real_path.startswith("pipe:"): resource_type = "pipe"
-                elif real_path.startswith("anon_inode:"): resource_type = "inode anônimo"
-                elif real_path.startswith("/dev/"): resource_type = "dispositivo"
-                elif real_path == "/": resource_type = "diretório raiz"
-                elif Path(real_path).is_dir(): resource_type = "diretório"
-                elif Path(real_path).is_fifo(): resource_type = "FIFO (pipe nomeado)"
-                elif Path(real_path).is_socket(): resource_type = "socket (filesystem)"
-                elif Path(real_path).is_symlink(): resource_type = "link simbólico"
-
-                open_files.append({
-                    'fd': fd,
-                    'path': real_path,
-                    'type': resource_type
-                })
-            except FileNotFoundError: continue # Recurso pode ter sido fechado.
-            except PermissionError:
-                open_files.append({
-                    'fd': fd_entry.name,
-                    'path': '[Permissão Negada]',
-                    'type': 'Desconhecido'
-                })
-            except Exception as e:
-                print(f"Aviso: Erro ao ler FD {fd_entry.name} para PID {pid}: {e}")
-                open_files.append({
-                    'fd': fd_entry.name,
-                    'path': '[Erro ao Ler]',
-                    'type': 'Desconhecido'
-                })
+        fd_names = os.listdir(fd_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return open_files # Retorna vazio se o diretório não existe.
     except PermissionError:
-        print(f"Erro de permissão: Não foi possível listar FDs para PID {pid}.")
+        log.debug(f"Erro de permissão: Não foi possível listar FDs para PID {pid}.")
+        return open_files
     except Exception as e:
-        print(f"Erro inesperado ao obter arquivos abertos para PID {pid}: {e}")
+        log.debug(f"Erro inesperado ao obter arquivos abertos para PID {pid}: {e}")
+        return open_files
+
+    for fd in fd_names: # Itera sobre as entradas no diretório /proc/[pid]/fd.
+        try:
+            real_path = os.readlink(f"{fd_dir}/{fd}") # Resolve o link simbólico para o caminho real.
+
+            # Determina o tipo de recurso com base no caminho real.
+            resource_type = "arquivo"
+            if real_path.startswith("socket:"): resource_type = "socket"
+            elif real_path.startswith("pipe:"): resource_type = "pipe"
+            elif real_path.startswith("anon_inode:"): resource_type = "inode anônimo"
+            elif real_path.startswith("/dev/"): resource_type = "dispositivo"
+            elif real_path == "/": resource_type = "diretório raiz"
+            else:
+                # Um único lstat responde todas as perguntas de tipo via
+                # st_mode, em vez de até quatro stat()/lstat() encadeados
+                # pelos is_*() do pathlib.
+                try:
+                    mode = os.lstat(real_path).st_mode
+                except OSError:
+                    mode = 0
+                if stat.S_ISDIR(mode): resource_type = "diretório"
+                elif stat.S_ISFIFO(mode): resource_type = "FIFO (pipe nomeado)"
+                elif stat.S_ISSOCK(mode): resource_type = "socket (filesystem)"
+                elif stat.S_ISLNK(mode): resource_type = "link simbólico"
+
+            open_files.append({
+                'fd': fd,
+                'path': real_path,
+                'type': resource_type
+            })
+        except FileNotFoundError: continue # Recurso pode ter sido fechado.
+        except PermissionError:
+            open_files.append({
+                'fd': fd,
+                'path': '[Permissão Negada]',
+                'type': 'Desconhecido'
+            })
+        except Exception as e:
+            log.debug(f"Aviso: Erro ao ler FD {fd} para PID {pid}: {e}")
+            open_files.append({
+                'fd': fd,
+                'path': '[Erro ao Ler]',
+                'type': 'Desconhecido'
+            })
 
     return open_files # Retorna a lista de recursos abertos.
 
@@ -523,27 +960,35 @@ def get_process_details(pid):
     """
     global CLK_TCK, PAGE_SIZE
     try:
-        proc_path = Path(f'/proc/{pid}')
-        if not proc_path.exists(): return None
+        if not os.path.exists(f'/proc/{pid}'): return None
 
-        # --- Leitura de /proc/[pid]/status para detalhes gerais e de memória ---
-        status_content = {}
+        # --- Leitura de /proc/[pid]/status apenas para os campos sem equivalente em statm ---
+        # Em vez de percorrer as ~50 linhas chave:valor, cada campo de
+        # interesse é localizado direto nos bytes com find() e fatiado até o
+        # fim da linha; as linhas não relacionadas nunca são parseadas.
         try:
-            with open(proc_path / 'status', 'r') as f:
-                for line in f:
-                    parts = line.split(":", 1)
-                    if len(parts) == 2:
-                        status_content[parts[0].strip()] = parts[1].strip()
+            status_data = read_proc_file_bytes(f'/proc/{pid}/status', 4096)
         except FileNotFoundError: return None
         except Exception as e:
-            print(f"Erro ao ler /proc/{pid}/status para PID {pid}: {e}")
+            log.debug(f"Erro ao ler /proc/{pid}/status para PID {pid}: {e}")
             return None
 
-        name_val = status_content.get('Name', 'N/A')
-        raw_state_val = status_content.get('State', 'N/A')
-        uid_str_val = status_content.get('Uid', 'N/A N/A N/A N/A').split()[0]
+        def _status_value(marker):
+            i = status_data.find(marker)
+            if i < 0:
+                return None
+            i += len(marker)
+            end = status_data.find(b'\n', i)
+            if end < 0:
+                end = len(status_data)
+            return status_data[i:end].strip().decode('utf-8', 'replace')
+
+        name_val = _status_value(b'Name:') or 'N/A'
+        raw_state_val = _status_value(b'\nState:') or 'N/A'
+        uid_field = _status_value(b'\nUid:')
+        uid_str_val = uid_field.split()[0] if uid_field else 'N/A'
         username_val = get_username_from_uid_local(int(uid_str_val)) if uid_str_val.isdigit() else 'N/A'
-        threads_in_details = status_content.get('Threads', 'N/A')
+        threads_in_details = _status_value(b'\nThreads:') or 'N/A'
 
         # --- Leitura de /proc/[pid]/stat para tempo de CPU, nice e tempo de início ---
         nice_val_from_stat = "N/A"
@@ -551,57 +996,68 @@ def get_process_details(pid):
         utime_ticks_val = 0
         stime_ticks_val = 0
         try:
-            with open(proc_path / 'stat', 'r') as f_stat:
-                stat_vals = f_stat.read().split()
+            stat_vals = read_proc_file_bytes(f'/proc/{pid}/stat', 4096).split()
             utime_ticks_val = int(stat_vals[13])
             stime_ticks_val = int(stat_vals[14])
             nice_val_from_stat = int(stat_vals[18])
             start_ticks_after_boot_val = int(stat_vals[21])
         except (FileNotFoundError, IndexError, ValueError) as e:
-            print(f"Aviso: Não foi possível ler alguns campos de /proc/{pid}/stat: {e}")
+            log.debug(f"Aviso: Não foi possível ler alguns campos de /proc/{pid}/stat: {e}")
 
         translated_priority_val = _translate_priority_from_nice(nice_val_from_stat if isinstance(nice_val_from_stat, int) else None)
         cpu_time_seconds = round((utime_ticks_val + stime_ticks_val) / CLK_TCK, 2)
 
         # --- Calcula o horário de início do processo ---
+        # Usa o horário de boot cacheado na carga do módulo (btime é invariante).
         process_start_str = "N/A"
-        system_boot_time_epoch = 0
         if isinstance(start_ticks_after_boot_val, int):
-            try:
-                with open('/proc/stat', 'r') as f_sys_stat:
-                    for line in f_sys_stat:
-                        if line.startswith('btime'):
-                            system_boot_time_epoch = int(line.split()[1])
-                            break
-            except (FileNotFoundError, ValueError) as e:
-                print(f"Aviso: Não foi possível ler o tempo de boot do sistema: {e}")
-
-            if system_boot_time_epoch > 0:
-                process_start_epoch = system_boot_time_epoch + (start_ticks_after_boot_val / CLK_TCK)
-                process_start_str = datetime.fromtimestamp(process_start_epoch).strftime('%d/%m/%Y %H:%M:%S')
+            if SYSTEM_BOOT_TIME_EPOCH > 0:
+                process_start_epoch = SYSTEM_BOOT_TIME_EPOCH + (start_ticks_after_boot_val / CLK_TCK)
+                process_start_str = format_local_timestamp(int(process_start_epoch))
             else:
                 process_start_str = f"{(start_ticks_after_boot_val / CLK_TCK):.2f}s após o boot"
 
-        # --- Informações de memória do processo (de /proc/[pid]/status) ---
-        vm_rss_str = status_content.get('VmRSS', '0 kB')
-        vm_size_str = status_content.get('VmSize', '0 kB')
-        rss_shmem_str = status_content.get('RssShmem', '0 kB')
-
-        # Converte strings de KB para inteiros para cálculos.
-        vm_rss_kb = _parse_kb_value_from_status_line(vm_rss_str)
-        vm_size_kb = _parse_kb_value_from_status_line(vm_size_str)
-        vm_exe_kb = _parse_kb_value_from_status_line(status_content.get('VmExe', '0 kB'))
-        vm_data_kb = _parse_kb_value_from_status_line(status_content.get('VmData', '0 kB'))
-        vm_stk_kb = _parse_kb_value_from_status_line(status_content.get('VmStk', '0 kB'))
-
-        # Calcula o número de páginas de memória para diferentes segmentos.
-        total_pages_resident = int(vm_rss_kb * 1024 / PAGE_SIZE) if PAGE_SIZE > 0 else 'N/A'
-        total_pages_virtual = int(vm_size_kb * 1024 / PAGE_SIZE) if PAGE_SIZE > 0 else 'N/A'
-        code_pages = int(vm_exe_kb * 1024 / PAGE_SIZE) if PAGE_SIZE > 0 else 'N/A'
-        data_heap_pages = int(vm_data_kb * 1024 / PAGE_SIZE) if PAGE_SIZE > 0 else 'N/A'
-        stack_pages = int(vm_stk_kb * 1024 / PAGE_SIZE) if PAGE_SIZE > 0 else 'N/A'
-
-        vm_data_str = status_content.get('VmData', '0 kB')
+        # --- Informações de memória do processo (de /proc/[pid]/statm) ---
+        # statm traz uma única linha com contagens de páginas (tamanho virtual,
+        # residente, compartilhada, código, dados+stack), bem mais barata de
+        # abrir e parsear do que o arquivo status, e já na unidade que o
+        # dashboard exibe (páginas).
+        size_pages = resident_pages = shared_pages = text_pages = data_stack_pages = 0
+        try:
+            statm_vals = read_proc_file_bytes(f'/proc/{pid}/statm', 256).split()
+            size_pages = int(statm_vals[0])
+            resident_pages = int(statm_vals[1])
+            shared_pages = int(statm_vals[2])
+            text_pages = int(statm_vals[3])
+            data_stack_pages = int(statm_vals[5])
+        except (FileNotFoundError, IndexError, ValueError) as e:
+            log.debug(f"Aviso: Não foi possível ler /proc/{pid}/statm: {e}")
+
+        # O stack não aparece separado em statm (o campo de dados agrega
+        # dados+stack), então VmStk continua vindo de status.
+        vm_stk_kb = _parse_kb_value_from_status_line(_status_value(b'\nVmStk:') or '0 kB')
+        stack_pages = vm_stk_kb // KB_PER_PAGE
+        data_heap_pages = max(0, data_stack_pages - stack_pages)
+
+        total_pages_resident = resident_pages
+        total_pages_virtual = size_pages
+        code_pages = text_pages
+
+        # Valores de memória em KB como inteiros: a camada de visualização
+        # formata direto com format_memory_kb_to_mb_gb, sem precisar reparsear
+        # strings "N kB" a cada render.
+        vm_rss_kb = resident_pages * PAGE_SIZE // 1024
+        vm_size_kb = size_pages * PAGE_SIZE // 1024
+        vm_data_kb = data_heap_pages * PAGE_SIZE // 1024
+
+        # Memória compartilhada: prefere os totais agregados de smaps_rollup
+        # (nunca o smaps completo); cai para o campo de statm em kernels
+        # antigos sem o rollup.
+        shared_kb_rollup = _read_smaps_rollup(pid)
+        if shared_kb_rollup is not None:
+            rss_shmem_kb = shared_kb_rollup
+        else:
+            rss_shmem_kb = shared_pages * PAGE_SIZE // 1024
 
         # --- Coleta informações sobre arquivos e recursos abertos ---
         open_files_and_resources = get_process_open_files(pid)
@@ -614,8 +1070,8 @@ def get_process_details(pid):
             'Estado': raw_state_val,
             'Número de Threads': threads_in_details,
 
-            'Memória Residente (VmRSS)': vm_rss_str,
-            'Memória Virtual (VmSize)': vm_size_str,
+            'Memória Residente (VmRSS)': vm_rss_kb,
+            'Memória Virtual (VmSize)': vm_size_kb,
 
             'Páginas Totais Residente': total_pages_resident,
             'Páginas Totais Virtual': total_pages_virtual,
@@ -623,8 +1079,8 @@ def get_process_details(pid):
             'Páginas de Dados/Heap (VmData)': data_heap_pages,
             'Páginas de Stack (VmStk)': stack_pages,
 
-            'Memória Compartilhada (RssShmem)': rss_shmem_str,
-            'Memória Gravável (VmData)': vm_data_str,
+            'Memória Compartilhada (RssShmem)': rss_shmem_kb,
+            'Memória Gravável (VmData)': vm_data_kb,
 
             'Tempo da CPU (s)': cpu_time_seconds,
             'Iniciado': process_start_str,
@@ -637,9 +1093,20 @@ def get_process_details(pid):
     except FileNotFoundError:
         return None
     except Exception as e:
-        print(f"Erro inesperado ao obter detalhes para PID {pid}: {e}")
+        log.debug(f"Erro inesperado ao obter detalhes para PID {pid}: {e}")
         return None
 
+# Tabela de tradução nice → prioridade, montada uma vez na carga do módulo e
+# indexada por nice + 20 (nice válido vai de -20 a 19): a cadeia de if/elif
+# vira um único acesso por índice, sem comparações encadeadas por chamada.
+_PRIORITY_LUT = (
+    ("Muito Alta",) * 6      # -20 .. -15
+    + ("Alta",) * 14         # -14 .. -1
+    + ("Normal",)            #   0
+    + ("Baixa",) * 10        #   1 .. 10
+    + ("Muito Baixa",) * 9   #  11 .. 19
+)
+
 def _translate_priority_from_nice(nice_value):
     """
     Converte um valor 'nice' numérico (de -20 a 19) para uma descrição textual da prioridade do processo.
@@ -649,9 +1116,7 @@ def _translate_priority_from_nice(nice_value):
        19: Menor prioridade para o processo (menos favorecido).
     """
     if not isinstance(nice_value, int): return "N/A"
-    if nice_value <= -15: return "Muito Alta"
-    elif nice_value <= -1: return "Alta"
-    elif nice_value == 0: return "Normal"
-    elif nice_value <= 10: return "Baixa"
-    elif nice_value <= 19: return "Muito Baixa"
-    else: return "Desconhecida"
\ No newline at end of file
+    if -20 <= nice_value <= 19:
+        return _PRIORITY_LUT[nice_value + 20]
+    # Fora da faixa convencional: mantém o comportamento da cadeia original.
+    return "Muito Alta" if nice_value < -20 else "Desconhecida"
\ No newline at end of file
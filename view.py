@@ -1,9 +1,149 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+import numpy as np
+import functools
+import time
 import os
-import stat
-from pathlib import Path
+import html
+from urllib.parse import quote
+
+# Memoização do carimbo de hora do cabeçalho: o strftime só roda de novo
+# quando o segundo inteiro vira; reruns dentro do mesmo segundo reaproveitam
+# a string pronta. Par [segundo, string] mutável no escopo do módulo.
+_last_caption_ts = [0, '']
+
+def _current_timestamp_str():
+    t = int(time.time())
+    if t != _last_caption_ts[0]:
+        _last_caption_ts[0] = t
+        _last_caption_ts[1] = time.strftime('%d/%m/%Y %H:%M:%S', time.localtime(t))
+    return _last_caption_ts[1]
+
+# Os formatadores abaixo são chamados uma vez por célula a cada atualização da
+# tabela; o grosso das entradas repete os mesmos valores (taxas zeradas,
+# memória estável). Os resultados são memoizados via lru_cache sobre o valor
+# quantizado em inteiro: acima de 1 KB o valor é arredondado ao múltiplo de
+# 16 bytes mais próximo, o que faz chaves quase iguais colidirem no cache e
+# desloca o texto exibido em no máximo uma unidade na última casa decimal
+# (erro ≤ 8 B ≈ 0,008 da unidade KB, e frações ainda menores em MB/GB).
+
+# Limiares de unidade pré-computados na carga do módulo: evita reavaliar
+# 1024**3 por chamada e deixa os testes como comparações de inteiro puras.
+# Os ramos abaixo testam do menor para o maior porque o caso comum de longe
+# são taxas zeradas/baixas (quase nenhum processo faz I/O num tick qualquer).
+_KB = 1 << 10
+_MB = 1 << 20
+_GB = 1 << 30
+
+# Folha de estilo única da página: tabelas markdown, cartões de métrica,
+# grade de diretórios e o respiro inferior (antes um st.markdown('<br>'*5)
+# por rerun). Injetada uma única vez por sessão, no início do layout:
+# reenviar blocos <style> a cada rerun só inflaria o payload do WebSocket e
+# forçaria o navegador a reparsear um CSS idêntico.
+_PAGE_CSS = """
+    <style>
+    div[data-testid="stMarkdownContainer"] > table { width: 100%; }
+    div[data-testid="stMarkdownContainer"] > table > thead > tr > th,
+    div[data-testid="stMarkdownContainer"] > table > tbody > tr > td {
+        text-align: center !important;
+        padding: 8px !important;
+    }
+    .metrics-row { display: flex; flex-wrap: wrap; gap: 12px; }
+    .metrics-row .m { flex: 1 1 0; min-width: 100px; text-align: center; }
+    .metrics-row .l { font-size: 0.8rem; opacity: 0.65; white-space: nowrap; }
+    .metrics-row .v { font-size: 1.5rem; }
+    .dir-grid { display: grid; grid-template-columns: repeat(5, 1fr); gap: 8px; }
+    .dir-grid .dir-card {
+        display: block; padding: 6px 10px; border-radius: 8px;
+        border: 1px solid rgba(128, 128, 128, 0.35);
+        text-decoration: none; overflow: hidden; text-overflow: ellipsis;
+        white-space: nowrap;
+    }
+    .block-container { padding-bottom: 6em; }
+    </style>
+"""
+
+def _inject_page_css():
+    """
+    Emite a folha de estilo da página apenas na primeira chamada da sessão.
+    """
+    if not st.session_state.get('_page_css_injected'):
+        st.markdown(_PAGE_CSS, unsafe_allow_html=True)
+        st.session_state['_page_css_injected'] = True
+
+@functools.lru_cache(maxsize=8192)
+def _format_bytes_rate_cached(q):
+    if q < _KB:
+        return f"{q:.1f} B/s"
+    elif q < _MB:
+        return f"{q / _KB:.2f} KB/s"
+    elif q < _GB:
+        return f"{q / _MB:.2f} MB/s"
+    else:
+        return f"{q / _GB:.2f} GB/s"
+
+def vec_format_bytes_rate(series):
+    """
+    Versão vetorizada de format_bytes_rate para colunas inteiras de DataFrame:
+    escolhe a unidade de cada linha com np.select e monta as strings com
+    operações de Series, em vez de um .apply com lambda por célula. O map com
+    precisão fixa preserva os zeros à direita ("1.50 KB/s", não "1.5 KB/s"),
+    igual aos formatadores escalares usados nos cartões de métrica.
+    """
+    v = series.astype('float64').clip(lower=0.0)
+    return pd.Series(
+        np.select(
+            [v >= _GB, v >= _MB, v >= _KB],
+            [(v / _GB).map('{:.2f}'.format) + ' GB/s',
+             (v / _MB).map('{:.2f}'.format) + ' MB/s',
+             (v / _KB).map('{:.2f}'.format) + ' KB/s'],
+            default=v.map('{:.1f}'.format) + ' B/s',
+        ),
+        index=series.index,
+    )
+
+def vec_format_memory_kb(series):
+    """
+    Versão vetorizada de format_memory_kb_to_mb_gb para colunas de DataFrame
+    com valores em KB: mesma mecânica do vec_format_bytes_rate, com seleção
+    de unidade e montagem das strings por coluna inteira em numpy/pandas.
+    """
+    v = series.astype('float64').clip(lower=0.0)
+    return pd.Series(
+        np.select(
+            [v >= _MB, v >= _KB],
+            [(v / _MB).map('{:.2f}'.format) + ' GB',
+             (v / _KB).map('{:.2f}'.format) + ' MB'],
+            default=v.astype('int64').astype(str) + ' KB',
+        ),
+        index=series.index,
+    )
+
+def vec_format_file_size(series):
+    """
+    Versão vetorizada de format_file_size para a coluna de tamanhos em bytes.
+    """
+    v = series.astype('float64').clip(lower=0.0)
+    return pd.Series(
+        np.select(
+            [v >= _GB, v >= _MB, v >= _KB],
+            [(v / _GB).map('{:.2f}'.format) + ' GB',
+             (v / _MB).map('{:.2f}'.format) + ' MB',
+             (v / _KB).map('{:.2f}'.format) + ' KB'],
+            default=v.astype('int64').astype(str) + ' B',
+        ),
+        index=series.index,
+    )
+
+@functools.lru_cache(maxsize=8192)
+def _format_memory_kb_cached(q):
+    # Entrada em KB: os limiares _KB/_MB aqui correspondem a MB/GB exibidos.
+    if q < _KB:
+        return f"{q} KB"
+    elif q < _MB:
+        return f"{q / _KB:.2f} MB"
+    else:
+        return f"{q / _MB:.2f} GB"
 
 def format_bytes_rate(bytes_val):
     """
@@ -11,31 +151,19 @@ def format_bytes_rate(bytes_val):
     """
     if not isinstance(bytes_val, (int, float)) or bytes_val < 0:
         return "0.0 B/s"
-    if bytes_val >= 1024 * 1024 * 1024:
-        return f"{bytes_val / (1024**3):.2f} GB/s"
-    elif bytes_val >= 1024 * 1024:
-        return f"{bytes_val / (1024**2):.2f} MB/s"
-    elif bytes_val >= 1024:
-        return f"{bytes_val / 1024:.2f} KB/s"
-    else:
-        return f"{bytes_val:.1f} B/s"
+    q = int(bytes_val)
+    if q >= _KB:
+        q = (q + 8) & ~0xF
+    return _format_bytes_rate_cached(q)
 
 def format_memory_kb_to_mb_gb(kb_value):
     """
     Converte um valor de memória em Kilobytes (KB) para uma string formatada
     em KB, Megabytes (MB) ou Gigabytes (GB).
     """
-    if not isinstance(kb_value, (int, float)) or kb_value < 0:
-        return "0 KB"
-    if kb_value == 0:
+    if not isinstance(kb_value, (int, float)) or kb_value <= 0:
         return "0 KB"
-
-    if kb_value >= 1024 * 1024:
-        return f"{kb_value / (1024*1024):.2f} GB"
-    elif kb_value >= 1024:
-        return f"{kb_value / 1024:.2f} MB"
-    else:
-        return f"{int(kb_value)} KB"
+    return _format_memory_kb_cached(int(kb_value))
 
 def format_file_size(size_bytes):
     """
@@ -43,21 +171,23 @@ def format_file_size(size_bytes):
     """
     if not isinstance(size_bytes, (int, float)) or size_bytes < 0:
         return "N/A"
-    if size_bytes >= 1024**3: # Gigabytes
-        return f"{size_bytes / (1024**3):.2f} GB"
-    elif size_bytes >= 1024**2: # Megabytes
-        return f"{size_bytes / (1024**2):.2f} MB"
-    elif size_bytes >= 1024: # Kilobytes
-        return f"{size_bytes / 1024:.2f} KB"
-    else: # Bytes
+    if size_bytes < _KB: # Bytes
         return f"{size_bytes} B"
+    elif size_bytes < _MB: # Kilobytes
+        return f"{size_bytes / _KB:.2f} KB"
+    elif size_bytes < _GB: # Megabytes
+        return f"{size_bytes / _MB:.2f} MB"
+    else: # Gigabytes
+        return f"{size_bytes / _GB:.2f} GB"
 
 def display_main_layout(global_info_data, processes_data, get_process_details_func, current_num_processes_value, filesystem_data, directory_contents_data, current_path, set_current_directory_path_func):
     """
     Define e exibe o layout principal da interface do dashboard.
     """
+    _inject_page_css()
+
     st.title("Dashboard de Monitoramento de Sistema")
-    st.caption(f"Última atualização: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+    st.caption(f"Última atualização: {_current_timestamp_str()}")
 
     # Adicionando a nova aba para detalhes de processos e recursos abertos
     tab_geral, tab_filesystem = st.tabs(["Geral", "Sistema de Arquivos"])
@@ -67,10 +197,15 @@ def display_main_layout(global_info_data, processes_data, get_process_details_fu
         display_global_info(global_info_data)
         st.markdown("---")
 
-        num_processes_input_val_str = st.text_input(
-            "Quantos processos visualizar?",
-            value=str(current_num_processes_value),
-        )
+        # Formulário em vez de text_input solto: o valor só é entregue no
+        # submit, então digitar "25" não dispara um rerun (e uma troca de
+        # limite do coletor) no "2" intermediário, caractere a caractere.
+        with st.form("num_procs_form", clear_on_submit=False):
+            num_processes_input_val_str = st.text_input(
+                "Quantos processos visualizar?",
+                value=str(current_num_processes_value),
+            )
+            st.form_submit_button("Aplicar")
 
         st.subheader(f"Processos")
         display_processes_table(processes_data)
@@ -78,29 +213,24 @@ def display_main_layout(global_info_data, processes_data, get_process_details_fu
 
         st.subheader("Detalhes de um Processo Específico")
 
-        pid_input_str = st.text_input(
-            label="Digite o ID do processo para ver detalhes:",
-            key="pid_details_text_input",
-            placeholder="Ex: 1234"
-        )
-
-        if pid_input_str:
-            try:
-                selected_pid = int(pid_input_str)
-                with st.spinner(f"Carregando detalhes para PID {selected_pid}..."):
-                    details = get_process_details_func(selected_pid)
-
-                if details:
-                    # Agora, display_process_details terá suas próprias abas internas
-                    display_process_details(details, processes_data, selected_pid)
-                else:
-                    st.warning(f"Processo com PID {selected_pid} não encontrado ou os dados não puderam ser acessados.")
-            except ValueError:
-                st.error("PID inválido. Por favor, insira apenas números (ex: 1234).")
-
-        st.markdown("<br>" * 5, unsafe_allow_html=True)
+        _process_details_fragment(get_process_details_func, processes_data)
 
     with tab_filesystem:
+        # Navegação vinda das âncoras da grade de diretórios: o clique chega
+        # como query param ?path= e vira um único rerun com o novo caminho.
+        # O isdir barra caminhos inválidos (URL antiga nos favoritos,
+        # diretório removido entre a listagem e o clique): como o controller
+        # rejeita caminhos assim sem alterar current_path, rodar o rerun
+        # mesmo assim deixaria a condição eternamente verdadeira e a página
+        # num laço infinito de reruns. Param ruim é simplesmente descartado.
+        query_path = st.query_params.get('path')
+        if query_path and query_path != current_path:
+            if os.path.isdir(query_path):
+                set_current_directory_path_func(query_path)
+                st.rerun()
+            else:
+                del st.query_params['path']
+
         st.subheader("Visão Geral do Sistema de Arquivos")
         display_filesystem_info(filesystem_data)
         st.markdown("---")
@@ -112,33 +242,172 @@ def display_main_layout(global_info_data, processes_data, get_process_details_fu
             if st.button("Voltar", key="up_dir_button"):
                 with st.spinner("Carregando diretório pai..."):
                     set_current_directory_path_func(parent_path)
+                # Mantém o query param coerente para a navegação por âncoras.
+                st.query_params['path'] = parent_path
                 st.rerun()
 
-        display_directory_navigation_buttons(directory_contents_data, set_current_directory_path_func)
+        # Particiona o conteúdo do diretório uma única vez: cada seção recebe
+        # só o que exibe, em vez de cada uma varrer a lista completa de novo.
+        dir_items = [i for i in directory_contents_data if i.get('type') == 'Diretório'] if directory_contents_data else []
+        file_items = [i for i in directory_contents_data if i.get('type') == 'Arquivo'] if directory_contents_data else []
+
+        display_directory_navigation_buttons(dir_items, set_current_directory_path_func)
 
         st.markdown("---")
         st.subheader("Conteúdo do Diretório Atual")
-        display_files_table(directory_contents_data)
+        display_files_table(file_items)
 
 
     return num_processes_input_val_str
 
+@st.fragment(run_every=5)
+def _process_details_fragment(get_process_details_func, processes_data):
+    """
+    Seção de detalhes de um processo, isolada em um fragment: ela relê e
+    reparseia /proc/[pid] no seu próprio ritmo (a cada 5 s ou quando o PID
+    digitado muda), sem bloquear o rerun principal da página — que segue na
+    cadência rápida do autorefresh — com I/O de detalhe por tick global.
+    """
+    # Formulário para o PID: a busca de detalhes (leituras de /proc +
+    # renderização) só roda no submit, não a cada tecla digitada.
+    with st.form("pid_details_form", clear_on_submit=False):
+        pid_input_str = st.text_input(
+            label="Digite o ID do processo para ver detalhes:",
+            key="pid_details_text_input",
+            placeholder="Ex: 1234"
+        )
+        st.form_submit_button("Buscar detalhes")
+
+    if pid_input_str:
+        try:
+            selected_pid = int(pid_input_str)
+            with st.spinner(f"Carregando detalhes para PID {selected_pid}..."):
+                details = get_process_details_func(selected_pid)
+
+            if details:
+                # Indexa os processos por PID uma única vez (comprehension
+                # roda em C) para o detalhe fazer um lookup O(1) em vez de
+                # varrer a lista linearmente.
+                processes_by_pid = {p['pid']: p for p in processes_data} if processes_data else {}
+                # Agora, display_process_details terá suas próprias abas internas
+                display_process_details(details, processes_by_pid, selected_pid)
+            else:
+                st.warning(f"Processo com PID {selected_pid} não encontrado ou os dados não puderam ser acessados.")
+        except ValueError:
+            st.error("PID inválido. Por favor, insira apenas números (ex: 1234).")
+
+@st.cache_data(ttl=1.0, max_entries=4, show_spinner=False)
+def _format_global_metrics(values):
+    """
+    Formata a tupla de valores globais para exibição. Cacheado por conteúdo:
+    entre ticks do coletor os valores não mudam, então os reruns do
+    autorefresh reaproveitam as strings prontas em vez de reformatar.
+    """
+    (cpu_pct, idle_pct, mem_used_kb, mem_pct, mem_free_pct,
+     disk_read_bps, disk_write_bps, total_procs, total_threads) = values
+    return (
+        cpu_pct, idle_pct,
+        format_memory_kb_to_mb_gb(mem_used_kb),
+        mem_pct, mem_free_pct,
+        format_bytes_rate(disk_read_bps),
+        format_bytes_rate(disk_write_bps),
+        total_procs, total_threads
+    )
+
+# Cartões de métrica renderizados como HTML num único st.markdown: cada
+# st.columns/col.metric é uma mensagem separada no protocolo do Streamlit,
+# então as nove métricas iam em dez chamadas por rerun; num bloco só, vai uma.
+# O CSS reproduz o visual do st.metric e é injetado uma vez por sessão.
+_METRIC_CARD = '<div class="m"><div class="l">{l}</div><div class="v">{v}</div></div>'
+
+_METRIC_LABELS = (
+    "CPU (%)", "CPU Ocioso (%)", "Memória Usada", "Memória Usada (%)",
+    "Memória Livre (%)", "Leitura Disco", "Escrita Disco",
+    "Total de Processos", "Total de Threads"
+)
+
 def display_global_info(global_info):
     """
     Exibe as informações globais do sistema em métricas formatadas.
+    A formatação dos valores é memoizada e os nove cartões são emitidos em
+    uma única chamada de st.markdown.
     """
-    col1, col2, col3, col4, col5, col6, col7, col8, col9 = st.columns(9)
-
-    col1.metric("CPU (%)", global_info.get("CPU (%)", 0.0))
-    col2.metric("CPU Ocioso (%)", global_info.get("CPU ocioso (%)", 0.0))
-    mem_used_kb_from_global = global_info.get("Memória Usada (KB)", 0)
-    col3.metric("Memória Usada", format_memory_kb_to_mb_gb(mem_used_kb_from_global))
-    col4.metric("Memória Usada (%)", global_info.get("Memória (%)", 0.0))
-    col5.metric("Memória Livre (%)", global_info.get("Memória Livre (%)", 0.0))
-    col6.metric("Leitura Disco", format_bytes_rate(global_info.get("Leitura Disco (B/s)", 0.0)))
-    col7.metric("Escrita Disco", format_bytes_rate(global_info.get("Escrita Disco (B/s)", 0.0)))
-    col8.metric("Total de Processos", global_info.get("Total de Processos", 0))
-    col9.metric("Total de Threads", global_info.get("Total de Threads", 0))
+    formatted = _format_global_metrics((
+        global_info.get("CPU (%)", 0.0),
+        global_info.get("CPU ocioso (%)", 0.0),
+        global_info.get("Memória Usada (KB)", 0),
+        global_info.get("Memória (%)", 0.0),
+        global_info.get("Memória Livre (%)", 0.0),
+        global_info.get("Leitura Disco (B/s)", 0.0),
+        global_info.get("Escrita Disco (B/s)", 0.0),
+        global_info.get("Total de Processos", 0),
+        global_info.get("Total de Threads", 0)
+    ))
+
+    st.markdown(
+        '<div class="metrics-row">'
+        + ''.join(_METRIC_CARD.format(l=l, v=v) for l, v in zip(_METRIC_LABELS, formatted))
+        + '</div>',
+        unsafe_allow_html=True
+    )
+
+# Ordem canônica das chaves dos registros de processo vindos do model: usada
+# para achatar cada dict em uma tupla hasheável, que serve tanto de chave de
+# cache para o st.cache_data quanto de linha para o DataFrame.
+_PROC_RECORD_KEYS = (
+    'pid', 'name', 'username', 'threads',
+    'cpu_percent', 'cpu_time', 'memory_percent', 'memory_mb',
+    'io_read_bps', 'io_write_bps'
+)
+
+# Nomes de exibição e ordem das colunas, congelados no escopo do módulo:
+# nada disso muda entre reruns, então não há por que realocar a cada render.
+# As colunas já nascem com o nome de exibição (alinhado posicionalmente a
+# _PROC_RECORD_KEYS), dispensando o passo de rename do DataFrame.
+_PROC_DISPLAY_NAMES = (
+    'ID', 'Nome', 'Usuário', 'Nº Threads',
+    '% CPU', 'Tempo CPU (s)', '% Memória', 'Memória (MB)',
+    'Leitura Disco (B/s)', 'Escrita Disco (B/s)'
+)
+
+_PREFERRED_ORDER = (
+    'ID', 'Nome', 'Usuário',
+    '% CPU', 'Tempo CPU (s)',
+    'Nº Threads',
+    'Memória (MB)', '% Memória',
+    'Leitura Disco (B/s)', 'Escrita Disco (B/s)'
+)
+
+@st.cache_data(ttl=1.0, max_entries=4, show_spinner=False)
+def _build_display_df(rows):
+    """
+    Monta o DataFrame de exibição dos processos (renomeado, reordenado e
+    formatado) a partir das linhas já achatadas em tuplas. Cacheado via
+    st.cache_data: reruns da interface com o mesmo snapshot de processos
+    (a coleta roda mais devagar que o autorefresh) reaproveitam o DataFrame
+    pronto em vez de reconstruí-lo e reformatá-lo do zero.
+    """
+    # Construção SoA: transpõe as linhas com zip (em C) e entrega ao pandas um
+    # dict de colunas já com os nomes de exibição, evitando a inferência
+    # linha a linha do construtor com lista de dicts e o rename posterior.
+    df_proc = pd.DataFrame(dict(zip(_PROC_DISPLAY_NAMES, zip(*rows))))
+
+    # Formatação em colunas inteiras, sem .apply por célula: as colunas de taxa
+    # passam pelo np.select vetorizado e as numéricas usam Series.map com o
+    # formatador de str pré-compilado, que itera em C sobre a coluna. As
+    # colunas prontas entram todas num único assign, dispensando o .copy()
+    # intermediário do DataFrame seguido de sobrescrita coluna a coluna.
+    # As colunas de percentual ficam numéricas: o st.dataframe as renderiza
+    # como ProgressColumn, com a formatação feita no cliente. O esquema das
+    # linhas é fixo (_PROC_RECORD_KEYS), então não há colunas opcionais a
+    # filtrar: a seleção final usa a ordem congelada diretamente.
+    formatted_cols = {
+        'Leitura Disco (B/s)': vec_format_bytes_rate(df_proc['Leitura Disco (B/s)']),
+        'Escrita Disco (B/s)': vec_format_bytes_rate(df_proc['Escrita Disco (B/s)']),
+        'Memória (MB)': df_proc['Memória (MB)'].map('{:.2f}'.format),
+        'Tempo CPU (s)': df_proc['Tempo CPU (s)'].map('{:.2f}'.format),
+    }
+    return df_proc.assign(**formatted_cols)[list(_PREFERRED_ORDER)]
 
 def display_processes_table(processes):
     """
@@ -148,76 +417,31 @@ def display_processes_table(processes):
         st.info("Nenhum processo para exibir ou aguardando atualização.")
         return
 
-    df_proc = pd.DataFrame(processes)
-
-    rename_dict = {
-        'pid': 'ID', 'name': 'Nome', 'username': 'Usuário',
-        'threads': 'Nº Threads',
-        'cpu_percent': '% CPU', 'cpu_time': 'Tempo CPU (s)',
-        'memory_percent': '% Memória', 'memory_mb': 'Memória (MB)',
-        'io_read_bps': 'Leitura Disco (B/s)',
-        'io_write_bps': 'Escrita Disco (B/s)'
-    }
-    df_proc = df_proc.rename(columns=lambda c: rename_dict.get(c, c))
-
-    preferred_order = [
-        'ID', 'Nome', 'Usuário',
-        '% CPU', 'Tempo CPU (s)',
-        'Nº Threads',
-        'Memória (MB)', '% Memória',
-        'Leitura Disco (B/s)', 'Escrita Disco (B/s)'
-    ]
-
-    cols_to_display = [col for col in preferred_order if col in df_proc.columns]
-
-    if not cols_to_display:
-        st.write("Dados de processos incompletos ou colunas não encontradas.")
-        return
-
-    df_proc_display = df_proc[cols_to_display].copy()
-
-    formatters = {
-        '% CPU': lambda x: f"{x:.1f}" if isinstance(x, (int, float)) else x,
-        'Memória (MB)': lambda x: f"{x:.2f}" if isinstance(x, (int, float)) else x,
-        '% Memória': lambda x: f"{x:.1f}" if isinstance(x, (int, float)) else x,
-        'Tempo CPU (s)': lambda x: f"{x:.2f}" if isinstance(x, (int, float)) else x,
-        'Leitura Disco (B/s)': lambda x: format_bytes_rate(x) if isinstance(x, (int, float)) else x,
-        'Escrita Disco (B/s)': lambda x: format_bytes_rate(x) if isinstance(x, (int, float)) else x,
-    }
-
-    for col_name, func in formatters.items():
-        if col_name in df_proc_display.columns:
-            df_proc_display[col_name] = df_proc_display[col_name].apply(func)
-
-    st.markdown("""
-        <style>
-        div[data-testid="stMarkdownContainer"] > table { width: 100%; }
-        div[data-testid="stMarkdownContainer"] > table > thead > tr > th,
-        div[data-testid="stMarkdownContainer"] > table > tbody > tr > td {
-            text-align: center !important;
-            padding: 8px !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-
-    st.markdown(df_proc_display.to_markdown(index=False), unsafe_allow_html=True)
-
-def format_memory_from_status(value_str):
-    """
-    Formata uma string de memória (geralmente de /proc/[pid]/status, no formato "1234 kB")
-    para um formato mais legível (KB, MB, GB).
-    """
-    if isinstance(value_str, str) and "kb" in value_str.lower():
-        try:
-            kb_value = int(value_str.lower().replace("kb", "").strip())
-            return format_memory_kb_to_mb_gb(kb_value)
-        except ValueError:
-            return value_str
-    return value_str
-
-def display_process_details(details, processes_data, current_pid):
+    # Achata os dicts em tuplas para ter uma chave hasheável e barata de
+    # comparar; o trabalho pesado fica no builder cacheado acima.
+    rows = tuple(tuple(p.get(k) for k in _PROC_RECORD_KEYS) for p in processes)
+    df_proc_display = _build_display_df(rows)
+
+    # Renderização nativa via Arrow: st.dataframe envia o DataFrame direto ao
+    # navegador, sem o to_markdown serializar célula a célula em Python nem o
+    # front-end reparsear uma tabela markdown/HTML gigante a cada refresh.
+    # Percentuais seguem como floats e viram barras de progresso formatadas
+    # no cliente, sem nenhuma formatação Python por célula.
+    st.dataframe(
+        df_proc_display,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            '% CPU': st.column_config.ProgressColumn(min_value=0, max_value=100, format='%.1f%%'),
+            '% Memória': st.column_config.ProgressColumn(min_value=0, max_value=100, format='%.1f%%'),
+        },
+    )
+
+def display_process_details(details, processes_by_pid, current_pid):
     """
     Exibe informações detalhadas de um processo específico em abas.
+    Recebe os processos já indexados por PID ({pid: proc}), de modo que o
+    cruzamento com a tabela de processos é um único lookup de hash.
     """
     if not details:
         st.warning("⚠️ Não foi possível acessar os detalhes deste processo.")
@@ -230,54 +454,97 @@ def display_process_details(details, processes_data, current_pid):
 
     with tab_overview:
         cpu_percent_str = "N/A"
-        if processes_data:
-            for proc_info in processes_data:
-                if proc_info.get('pid') == current_pid:
-                    cpu_percent_val = proc_info.get('cpu_percent')
-                    if isinstance(cpu_percent_val, (float, int)):
-                        cpu_percent_str = f"{cpu_percent_val:.1f}%"
-                    break
+        proc_info = processes_by_pid.get(current_pid) if processes_by_pid else None
+        if proc_info is not None:
+            cpu_percent_val = proc_info.get('cpu_percent')
+            if isinstance(cpu_percent_val, (float, int)):
+                cpu_percent_str = f"{cpu_percent_val:.1f}%"
 
         col_info1, col_info2 = st.columns(2)
 
+        # Cada st.markdown é um widget próprio no protocolo de deltas do
+        # Streamlit; as linhas de cada coluna são concatenadas e emitidas em
+        # uma única chamada por coluna.
         with col_info1:
-            st.markdown(f"**Nome:** {details.get('Nome', 'N/A')}")
-            st.markdown(f"**Usuário:** {details.get('Usuário', 'N/A')}")
-            st.markdown(f"**Estado:** {details.get('Estado', 'N/A')}")
-            st.markdown(f"**CPU:** {cpu_percent_str}")
-            st.markdown(f"**Número de Threads:** {details.get('Número de Threads', 'N/A')}")
+            st.markdown("  \n".join((
+                f"**Nome:** {details.get('Nome', 'N/A')}",
+                f"**Usuário:** {details.get('Usuário', 'N/A')}",
+                f"**Estado:** {details.get('Estado', 'N/A')}",
+                f"**CPU:** {cpu_percent_str}",
+                f"**Número de Threads:** {details.get('Número de Threads', 'N/A')}",
+            )))
 
         with col_info2:
-            st.markdown(f"**Iniciado:** {details.get('Iniciado', 'N/A')}")
-            st.markdown(f"**Tempo da CPU:** {details.get('Tempo da CPU (s)', 'N/A')} s")
-            st.markdown(f"**Prioridade:** {details.get('Prioridade', 'N/A')}")
-            st.markdown(f"**Nice:** {details.get('Nice', 'N/A')}")
+            st.markdown("  \n".join((
+                f"**Iniciado:** {details.get('Iniciado', 'N/A')}",
+                f"**Tempo da CPU:** {details.get('Tempo da CPU (s)', 'N/A')} s",
+                f"**Prioridade:** {details.get('Prioridade', 'N/A')}",
+                f"**Nice:** {details.get('Nice', 'N/A')}",
+            )))
 
     with tab_memory:
         st.markdown("##### Informações de Memória do Processo")
 
         mem_col1, mem_col2 = st.columns(2)
 
+        # O model entrega os campos de memória como inteiros em KB: a
+        # formatação é uma chamada direta ao formatador memoizado, sem
+        # reparsear strings "N kB" a cada render.
         with mem_col1:
-            st.markdown("**Memória Alocada:**")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Residente (VmRSS): {format_memory_from_status(details.get('Memória Residente (VmRSS)', 'N/A'))}")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Virtual (VmSize): {format_memory_from_status(details.get('Memória Virtual (VmSize)', 'N/A'))}")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Compartilhada Residente (RssShmem): {format_memory_from_status(details.get('Memória Compartilhada (RssShmem)', 'N/A'))}")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Gravável (VmData): {format_memory_from_status(details.get('Memória Gravável (VmData)', 'N/A'))}")
+            st.markdown("  \n".join((
+                "**Memória Alocada:**",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Residente (VmRSS): {format_memory_kb_to_mb_gb(details.get('Memória Residente (VmRSS)', 0))}",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Virtual (VmSize): {format_memory_kb_to_mb_gb(details.get('Memória Virtual (VmSize)', 0))}",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Compartilhada Residente (RssShmem): {format_memory_kb_to_mb_gb(details.get('Memória Compartilhada (RssShmem)', 0))}",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Gravável (VmData): {format_memory_kb_to_mb_gb(details.get('Memória Gravável (VmData)', 0))}",
+            )))
 
         with mem_col2:
-            st.markdown("**Páginas de Memória:**")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Totais (Residente): {details.get('Páginas Totais Residente', 'N/A')}")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Totais (Virtual): {details.get('Páginas Totais Virtual', 'N/A')}")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Código (VmExe): {details.get('Páginas de Código (VmExe)', 'N/A')}")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Dados/Heap (VmData): {details.get('Páginas de Dados/Heap (VmData)', 'N/A')}")
-            st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;Stack (VmStk): {details.get('Páginas de Stack (VmStk)', 'N/A')}")
+            st.markdown("  \n".join((
+                "**Páginas de Memória:**",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Totais (Residente): {details.get('Páginas Totais Residente', 'N/A')}",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Totais (Virtual): {details.get('Páginas Totais Virtual', 'N/A')}",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Código (VmExe): {details.get('Páginas de Código (VmExe)', 'N/A')}",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Dados/Heap (VmData): {details.get('Páginas de Dados/Heap (VmData)', 'N/A')}",
+                f"&nbsp;&nbsp;&nbsp;&nbsp;Stack (VmStk): {details.get('Páginas de Stack (VmStk)', 'N/A')}",
+            )))
 
     with tab_io:
         st.markdown("##### Recursos Abertos e I/O do Processo")
         display_open_resources(details.get('Recursos Abertos', []))
 
 
+_PARTITION_RECORD_KEYS = (
+    'name', 'mount_point', 'fs_type',
+    'total_size_kb', 'used_kb', 'free_kb', 'usage_percent'
+)
+_PARTITION_DISPLAY_NAMES = (
+    'Nome da Partição', 'Ponto de Montagem', 'Tipo FS',
+    'Tamanho Total (KB)', 'Usado (KB)', 'Livre (KB)', 'Uso (%)'
+)
+
+@st.cache_data(ttl=30.0, max_entries=8, show_spinner=False)
+def _render_partitions_md(rows):
+    """
+    Monta e formata a tabela de partições e devolve o markdown final.
+    Cacheado por conteúdo: reruns com o mesmo conjunto de partições
+    reaproveitam a string pronta em vez de reconstruir o DataFrame.
+    """
+    # Construção SoA com os nomes de exibição direto nas colunas (alinhados a
+    # _PARTITION_RECORD_KEYS), sem rename posterior.
+    df_partitions = pd.DataFrame(dict(zip(_PARTITION_DISPLAY_NAMES, zip(*rows))))
+
+    # Colunas formatadas de uma vez pelos formatadores vetorizados, sem
+    # invocar uma função Python por célula via .apply.
+    df_partitions['Tamanho Total (KB)'] = vec_format_memory_kb(df_partitions['Tamanho Total (KB)'])
+    df_partitions['Usado (KB)'] = vec_format_memory_kb(df_partitions['Usado (KB)'])
+    df_partitions['Livre (KB)'] = vec_format_memory_kb(df_partitions['Livre (KB)'])
+    df_partitions['Uso (%)'] = df_partitions['Uso (%)'].round(2).astype(str) + '%'
+
+    # to_html do pandas em vez de to_markdown: evita o tabulate iterando
+    # célula a célula em Python para montar a tabela.
+    return df_partitions.to_html(index=False, border=0)
+
 def display_filesystem_info(filesystem_data):
     """
     Exibe as informações do sistema de arquivos.
@@ -291,118 +558,98 @@ def display_filesystem_info(filesystem_data):
     partitions = filesystem_data.get('partitions', [])
     if partitions:
         st.subheader("Partições do Sistema")
-        df_partitions = pd.DataFrame(partitions)
-
-        df_partitions = df_partitions.rename(columns={
-            'name': 'Nome da Partição',
-            'mount_point': 'Ponto de Montagem',
-            'fs_type': 'Tipo FS',
-            'total_size_kb': 'Tamanho Total (KB)',
-            'used_kb': 'Usado (KB)',
-            'free_kb': 'Livre (KB)',
-            'usage_percent': 'Uso (%)'
-        })
-
-        df_partitions['Tamanho Total (KB)'] = df_partitions['Tamanho Total (KB)'].apply(format_memory_kb_to_mb_gb)
-        df_partitions['Usado (KB)'] = df_partitions['Usado (KB)'].apply(format_memory_kb_to_mb_gb)
-        df_partitions['Livre (KB)'] = df_partitions['Livre (KB)'].apply(format_memory_kb_to_mb_gb)
-        df_partitions['Uso (%)'] = df_partitions['Uso (%)'].apply(lambda x: f"{x:.2f}%")
-
-        st.markdown("""
-            <style>
-            div[data-testid="stMarkdownContainer"] > table { width: 100%; }
-            div[data-testid="stMarkdownContainer"] > table > thead > tr > th,
-            div[data-testid="stMarkdownContainer"] > table > tbody > tr > td {
-                text-align: center !important;
-                padding: 8px !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-
-        st.markdown(df_partitions.to_markdown(index=False), unsafe_allow_html=True)
+        # Achata as partições em tuplas e delega ao renderizador cacheado:
+        # como o model reaproveita os statvfs dentro da janela do cache, o
+        # conteúdo fica idêntico por vários reruns seguidos.
+        rows = tuple(tuple(p.get(k) for k in _PARTITION_RECORD_KEYS) for p in partitions)
+        st.markdown(_render_partitions_md(rows), unsafe_allow_html=True)
 
     else:
         st.info("Nenhuma partição encontrada.")
 
 
-def display_directory_navigation_buttons(contents, set_current_directory_path_func):
+# Grade de navegação de diretórios em HTML: cada st.button é uma mensagem
+# separada no protocolo do Streamlit (centenas delas em /usr/lib ou
+# /var/log). A grade inteira vai num único st.markdown, com âncoras que
+# navegam via query param ?path= — o clique dispara um único rerun com o
+# novo caminho, tratado em display_main_layout.
+def display_directory_navigation_buttons(dir_items, set_current_directory_path_func):
     """
-    Exibe apenas os botões de diretório para navegação.
+    Exibe a grade de diretórios para navegação. Recebe a lista já filtrada
+    para diretórios e confia na classificação feita pelo scanner do model —
+    reconferir com is_dir() aqui custaria um stat() por entrada a cada rerun.
     """
-    if not contents:
+    if not dir_items:
         return
 
     st.markdown("---")
     st.write("Clique em um diretório abaixo para navegar:")
 
-    dir_buttons_cols = st.columns(5)
+    # html.escape no nome: o bloco vai com unsafe_allow_html, e um diretório
+    # com '&'/'<' no nome quebraria a marcação (ou injetaria atributos).
+    cards = ''.join(
+        f'<a class="dir-card" target="_self" href="?path={quote(item["full_path"])}">'
+        f'📂 {html.escape(item.get("name", "N/A"))}</a>'
+        for item in dir_items if item.get('full_path')
+    )
+    st.markdown(f'<div class="dir-grid">{cards}</div>', unsafe_allow_html=True)
+
+_FILE_RECORD_KEYS = (
+    'name', 'type', 'size',
+    'owner_username', 'permissions_str', 'last_modified'
+)
+_FILE_DISPLAY_NAMES = (
+    'Nome do Arquivo', 'Tipo', 'Tamanho',
+    'Proprietário', 'Permissões (String)', 'Última Modificação'
+)
+
+@st.cache_data(ttl=2.0, max_entries=8, show_spinner=False)
+def _render_files_html(rows):
+    """
+    Monta e formata a tabela de arquivos e devolve o HTML final. Cacheado por
+    conteúdo: enquanto o diretório exibido não muda entre reruns, a string
+    pronta é reaproveitada.
+    """
+    # Caminho rápido para diretórios pequenos (o caso comum): montar o HTML
+    # direto das tuplas sai mais barato que pagar a inicialização de um
+    # DataFrame + formatação vetorizada para meia dúzia de linhas.
+    if len(rows) < 32:
+        head = ''.join(f'<th>{h}</th>' for h in _FILE_DISPLAY_NAMES)
+        body = ''.join(
+            f'<tr><td>{html.escape(str(name))}</td><td>{html.escape(str(ftype))}</td>'
+            f'<td>{format_file_size(size)}</td><td>{html.escape(str(owner))}</td>'
+            f'<td>{html.escape(str(perms))}</td><td>{mtime}</td></tr>'
+            for name, ftype, size, owner, perms, mtime in rows
+        )
+        return (
+            '<table border="0" class="dataframe"><thead><tr>' + head
+            + '</tr></thead><tbody>' + body + '</tbody></table>'
+        )
+
+    # Construção SoA com os nomes de exibição direto nas colunas (alinhados a
+    # _FILE_RECORD_KEYS), sem rename posterior.
+    df_files = pd.DataFrame(dict(zip(_FILE_DISPLAY_NAMES, zip(*rows))))
 
-    i = 0
-    for idx, item_dict in enumerate(contents):
-        item_name = item_dict.get('name', 'N/A')
-        item_type = item_dict.get('type', 'N/A')
-        current_item_full_path = item_dict.get('full_path')
+    # Formatação da coluna inteira em uma passada vetorizada: relevante em
+    # diretórios com milhares de arquivos, onde o .apply pagava uma
+    # chamada Python por linha.
+    df_files['Tamanho'] = vec_format_file_size(df_files['Tamanho'])
 
-        # Apenas cria o botão se for um diretório e o caminho for acessível e existir
-        if item_type == 'Diretório' and current_item_full_path and Path(current_item_full_path).is_dir():
-            with dir_buttons_cols[i % 5]:
-                if st.button(f"📂 {item_name}", key=f"dir_button_{current_item_full_path}_{idx}"):
-                    with st.spinner(f"Abrindo {item_name}..."):
-                        set_current_directory_path_func(current_item_full_path)
-                    st.rerun()
-            i += 1
+    # to_html do pandas em vez de to_markdown: evita o tabulate iterando
+    # célula a célula em Python para montar a tabela.
+    return df_files.to_html(index=False, border=0)
 
-def display_files_table(contents):
+def display_files_table(file_items):
     """
     Exibe uma tabela com os arquivos e seus atributos no diretório atual, incluindo o nome do proprietário.
+    Recebe a lista já filtrada para arquivos pelo chamador.
     """
-    if not contents:
-        st.info("Nenhum arquivo para exibir no diretório atual.")
-        return
-
-    files_only = [item for item in contents if item.get('type') == 'Arquivo']
-
-    if not files_only:
+    if not file_items:
         st.info("Nenhum arquivo encontrado neste diretório.")
         return
 
-    df_files = pd.DataFrame(files_only)
-
-    df_files = df_files.rename(columns={
-        'name': 'Nome do Arquivo',
-        'type': 'Tipo',
-        'size': 'Tamanho',
-        'permissions_str': 'Permissões (String)',
-        'last_modified': 'Última Modificação',
-        'owner_username': 'Proprietário'  # Renomeia para 'Proprietário'
-    })
-
-    cols_to_display = [
-        'Nome do Arquivo',
-        'Tipo',
-        'Tamanho',
-        'Proprietário',  # Usa a nova coluna 'Proprietário'
-        'Permissões (String)',
-        'Última Modificação'
-    ]
-
-    df_files_display = df_files[[col for col in cols_to_display if col in df_files.columns]].copy()
-
-    if 'Tamanho' in df_files_display.columns:
-        df_files_display['Tamanho'] = df_files_display['Tamanho'].apply(format_file_size)
-
-    st.markdown("""
-        <style>
-        div[data-testid="stMarkdownContainer"] > table { width: 100%; }
-        div[data-testid="stMarkdownContainer"] > table > thead > tr > th,
-        div[data-testid="stMarkdownContainer"] > table > tbody > tr > td {
-            text-align: center !important;
-            padding: 8px !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-
-    st.markdown(df_files_display.to_markdown(index=False), unsafe_allow_html=True)
+    rows = tuple(tuple(item.get(k) for k in _FILE_RECORD_KEYS) for item in file_items)
+    st.markdown(_render_files_html(rows), unsafe_allow_html=True)
 
 def display_open_resources(resources_data):
     """
@@ -412,31 +659,14 @@ def display_open_resources(resources_data):
         st.info("Nenhum recurso aberto encontrado ou permissão negada para este processo.")
         return
 
-    df_resources = pd.DataFrame(resources_data)
-
-    df_resources = df_resources.rename(columns={
-        'fd': 'Descritor (FD)',
-        'path': 'Caminho / Detalhe',
-        'type': 'Tipo de Recurso'
+    # Construção SoA: dict de colunas já com os nomes e a ordem de exibição,
+    # sem o construtor por lista de dicts nem rename/seleção/cópia depois.
+    df_resources_display = pd.DataFrame({
+        'Descritor (FD)': [r.get('fd') for r in resources_data],
+        'Tipo de Recurso': [r.get('type') for r in resources_data],
+        'Caminho / Detalhe': [r.get('path') for r in resources_data],
     })
 
-    cols_to_display = [
-        'Descritor (FD)',
-        'Tipo de Recurso',
-        'Caminho / Detalhe'
-    ]
-
-    df_resources_display = df_resources[[col for col in cols_to_display if col in df_resources.columns]].copy()
-
-    st.markdown("""
-        <style>
-        div[data-testid="stMarkdownContainer"] > table { width: 100%; }
-        div[data-testid="stMarkdownContainer"] > table > thead > tr > th,
-        div[data-testid="stMarkdownContainer"] > table > tbody > tr > td {
-            text-align: center !important;
-            padding: 8px !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-
-    st.markdown(df_resources_display.to_markdown(index=False), unsafe_allow_html=True)
\ No newline at end of file
+    # to_html do pandas em vez de to_markdown: evita o tabulate iterando
+    # célula a célula em Python para montar a tabela.
+    st.markdown(df_resources_display.to_html(index=False, border=0), unsafe_allow_html=True)
\ No newline at end of file